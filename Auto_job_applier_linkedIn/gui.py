@@ -13,32 +13,210 @@ Pages:
 
 import sys
 import os
+import collections
+import functools
+import importlib
+import threading
+import time
 from pathlib import Path
 
 try:
     from PySide6 import QtCore, QtWidgets, QtGui
 except Exception as e:
-    print("PySide6 is not installed. Install it with: pip install PySide6")
+    sys.stderr.write("PySide6 is not installed. Install it with: pip install PySide6\n")
     raise
 
 
+# Application-wide stylesheet, applied once; widgets opt in via objectName
+APP_QSS = """
+QFrame#navRail {
+    background-color: #2c3e50;
+    border-right: 1px solid #34495e;
+}
+QFrame#navRail QPushButton {
+    /* 90x70 outer size: content box plus 12px padding each side */
+    min-width: 66px;
+    max-width: 66px;
+    min-height: 46px;
+    max-height: 46px;
+    background-color: transparent;
+    color: #ecf0f1;
+    border: none;
+    padding: 12px;
+    text-align: center;
+    font-size: 11px;
+}
+QFrame#navRail QPushButton:hover {
+    background-color: #34495e;
+}
+QFrame#navRail QPushButton:checked {
+    background-color: #3498db;
+    font-weight: bold;
+}
+QFrame#captchaBanner {
+    background-color: #fff3cd;
+    border: 2px solid #ffc107;
+    border-radius: 4px;
+    padding: 10px;
+}
+QLabel#captchaIcon {
+    font-size: 24px;
+}
+QFrame#statCard {
+    background-color: #ecf0f1;
+    border: 1px solid #bdc3c7;
+    border-radius: 8px;
+    padding: 15px;
+}
+QLabel#statTitle {
+    font-size: 14px;
+    color: #7f8c8d;
+}
+QLabel#statValue {
+    font-size: 36px;
+    font-weight: bold;
+    color: #2c3e50;
+}
+QLabel#statDescription {
+    font-size: 11px;
+    color: #95a5a6;
+}
+QLabel#pageTitle {
+    font-size: 24px;
+    font-weight: bold;
+    padding: 15px;
+}
+QLabel#pageInfo {
+    color: #7f8c8d;
+    padding: 0 15px;
+}
+QLabel#configInfo {
+    color: #7f8c8d;
+    padding: 15px;
+    font-size: 11px;
+}
+"""
+
+@functools.lru_cache(maxsize=None)
+def _lazy_module(name):
+    """Import a module on first use; later calls return the cached module object.
+
+    Failed imports are not cached, so a missing optional dependency is retried.
+    """
+    return importlib.import_module(name)
+
+
+# Nav rail entries (page name, icon); a button's group id is its index here
+_NAV_ITEMS = (
+    ("Dashboard", "📊"),
+    ("Jobs", "💼"),
+    ("Queue", "📋"),
+    ("History", "📜"),
+    ("AI", "🤖"),
+    ("Settings", "⚙️"),
+)
+
+# Run states: (run enabled, pause enabled, stop enabled, status bar text)
+_RUN_STATES = {
+    "idle": (True, False, False, "🔴 Automation: Idle"),
+    "running": (False, True, True, "🟢 Automation: Running"),
+    "paused": (True, False, True, "🟢 Automation: Running"),
+    "stopping": (False, False, False, "🟡 Automation: Stopping"),
+}
+
+# Jobs page progress label formatters
+_fmt_applied = "✅ Applied: {}".format
+_fmt_failed = "❌ Failed: {}".format
+_fmt_skipped = "⏭️ Skipped: {}".format
+_fmt_current = "📌 Current: {}".format
+
+# Activity log tags per level, e.g. " [INFO] "
+_LEVEL_PREFIX = {
+    "info": " [INFO] ",
+    "success": " [SUCCESS] ",
+    "warning": " [WARNING] ",
+    "error": " [ERROR] ",
+    "debug": " [DEBUG] "
+}
+
+# Activity log colours per level
+_LOG_COLORS = {
+    "info": "#3498db",
+    "success": "#27ae60",
+    "warning": "#f39c12",
+    "error": "#e74c3c",
+    "debug": "#95a5a6"
+}
+
+
 class MainWindow(QtWidgets.QMainWindow):
+    # Stop grace period: poll the worker every STOP_POLL_MS, up to STOP_MAX_POLLS times
+    STOP_POLL_MS = 100
+    STOP_MAX_POLLS = 20
+    # Lines kept in the activity log; older ones drop off the top
+    LOG_MAX_LINES = 2000
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Auto Job Applier - LinkedIn Automation")
         self.resize(1200, 800)
         self.setMinimumSize(1000, 700)
+        QtWidgets.QApplication.instance().setStyleSheet(APP_QSS)
         
         # Application state
         self.worker = None
+        self._run_state = "idle"  # key of _RUN_STATES the controls currently show
+        # One long-lived thread for automation runs, separate from the global pool
+        # so short background tasks (browser close, AI test) never queue behind a run
+        self._automation_pool = QtCore.QThreadPool(self)
+        self._automation_pool.setMaxThreadCount(1)
+        self._automation_pool.setExpiryTimeout(-1)
         self.current_page = "Dashboard"
+        self._bg_tasks = set()  # signals of _BackgroundTasks still in flight
+        self._recent = collections.deque(maxlen=50)  # dashboard activity feed, newest first
+        self._info_box = None  # shared information dialog, created on first use
+        self._confirm_box = None  # shared Yes/No dialog, created on first use
+
+        # Log lines are buffered and appended in one go at most every 50 ms
+        # Bounded like the document: lines past the limit would be trimmed right after insertion
+        self._log_buf = collections.deque(maxlen=self.LOG_MAX_LINES)  # (level, line) pairs
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+        # Worker progress (counts and form fill) is sampled every 100 ms while a run is active
+        self._shown_progress = None
+        self._shown_counts = None  # (applied, failed, skipped) currently on the labels
+        self._shown_job = None  # job title currently on the label
+        self._shown_form_pct = 0  # value currently on the form fill bar
+        self._progress_divisor = 0.0  # 100 / max applications of the current run
+        self._progress_timer = QtCore.QTimer(self)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._poll_worker_progress)
+        # Worker log lines are buffered on the worker; logs_ready arms a 50 ms drain
+        self._worker_log_timer = QtCore.QTimer(self)
+        self._worker_log_timer.setSingleShot(True)
+        self._worker_log_timer.setInterval(50)
+        self._worker_log_timer.timeout.connect(self._drain_worker_logs)
+        self._ts_second = -1
+        self._ts_cached = ""
+        
+        # Log lines are inserted as plain text; colour comes from a char format per level
+        self._fmt_by_level = {}
+        for level, color in _LOG_COLORS.items():
+            fmt = QtGui.QTextCharFormat()
+            fmt.setForeground(QtGui.QColor(color))
+            self._fmt_by_level[level] = fmt
+        self._fmt_default = QtGui.QTextCharFormat()
         
         self._setup_ui()
         self._setup_statusbar()
-        self._setup_menubar()
         
-        # Initialize with Dashboard
+        # Initialize with Dashboard; the menubar and the other pages are
+        # built on the event loop once the window has had its first paint
         self._switch_page("Dashboard")
+        QtCore.QTimer.singleShot(0, self._setup_menubar)
+        QtCore.QTimer.singleShot(0, self._build_remaining_pages)
 
     def _setup_menubar(self):
         """Create menu bar"""
@@ -91,50 +269,24 @@ class MainWindow(QtWidgets.QMainWindow):
         """Create left navigation rail"""
         nav = QtWidgets.QFrame()
         nav.setFixedWidth(100)
-        nav.setStyleSheet("""
-            QFrame {
-                background-color: #2c3e50;
-                border-right: 1px solid #34495e;
-            }
-            QPushButton {
-                background-color: transparent;
-                color: #ecf0f1;
-                border: none;
-                padding: 12px;
-                text-align: center;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #34495e;
-            }
-            QPushButton:checked {
-                background-color: #3498db;
-                font-weight: bold;
-            }
-        """)
+        nav.setObjectName("navRail")
         
         nav_layout = QtWidgets.QVBoxLayout(nav)
         nav_layout.setContentsMargins(0, 10, 0, 10)
         nav_layout.setSpacing(5)
         nav_layout.setAlignment(QtCore.Qt.AlignTop)
 
-        # Navigation buttons
+        # Navigation buttons; the exclusive group keeps exactly one checked
         self.nav_buttons = {}
-        nav_items = [
-            ("Dashboard", "📊"),
-            ("Jobs", "💼"),
-            ("Queue", "📋"),
-            ("History", "📜"),
-            ("AI", "🤖"),
-            ("Settings", "⚙️"),
-        ]
-
-        for name, icon in nav_items:
+        self.nav_group = QtWidgets.QButtonGroup(self)
+        self.nav_group.setExclusive(True)
+        self.nav_group.idClicked.connect(self._nav_id_clicked)
+        hand = QtGui.QCursor(QtCore.Qt.PointingHandCursor)
+        for nav_id, (name, icon) in enumerate(_NAV_ITEMS):
             btn = QtWidgets.QPushButton(f"{icon}\n{name}")
-            btn.setFixedSize(90, 70)
             btn.setCheckable(True)
-            btn.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
-            btn.clicked.connect(lambda checked, n=name: self._switch_page(n))
+            btn.setCursor(hand)
+            self.nav_group.addButton(btn, nav_id)
             nav_layout.addWidget(btn)
             self.nav_buttons[name] = btn
 
@@ -157,13 +309,20 @@ class MainWindow(QtWidgets.QMainWindow):
         self.pages = QtWidgets.QStackedWidget()
         content_layout.addWidget(self.pages, 1)
 
-        # Create all pages
-        self.pages.addWidget(self._create_dashboard_page())
-        self.pages.addWidget(self._create_jobs_page())
-        self.pages.addWidget(self._create_queue_page())
-        self.pages.addWidget(self._create_history_page())
-        self.pages.addWidget(self._create_ai_page())
-        self.pages.addWidget(self._create_settings_page())
+        # Pages are built on first visit (see _ensure_page); empty placeholders
+        # keep the stack indices stable until then
+        self._page_factories = {
+            "Dashboard": self._create_dashboard_page,
+            "Jobs": self._create_jobs_page,
+            "Queue": self._create_queue_page,
+            "History": self._create_history_page,
+            "AI": self._create_ai_page,
+            "Settings": self._create_settings_page,
+        }
+        self._page_index = {name: i for i, name in enumerate(self._page_factories)}
+        self._page_built = set()
+        for _ in self._page_factories:
+            self.pages.addWidget(QtWidgets.QWidget())
 
         # Shared log area at bottom
         log_group = QtWidgets.QGroupBox("Activity Log")
@@ -176,8 +335,13 @@ class MainWindow(QtWidgets.QMainWindow):
         log_toolbar.addWidget(clear_btn)
         log_layout.addLayout(log_toolbar)
         
-        self.log_text = QtWidgets.QTextEdit()
+        # Plain-text log with a fixed block budget: old lines drop off the top
+        self.log_text = QtWidgets.QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(self.LOG_MAX_LINES)
+        # Cursor inserts would otherwise be recorded on the undo stack forever
+        self.log_text.setUndoRedoEnabled(False)
+        self.log_text.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
         self.log_text.setMaximumHeight(150)
         log_layout.addWidget(self.log_text)
         
@@ -189,20 +353,13 @@ class MainWindow(QtWidgets.QMainWindow):
         """Create CAPTCHA notification banner"""
         banner = QtWidgets.QFrame()
         banner.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        banner.setStyleSheet("""
-            QFrame {
-                background-color: #fff3cd;
-                border: 2px solid #ffc107;
-                border-radius: 4px;
-                padding: 10px;
-            }
-        """)
+        banner.setObjectName("captchaBanner")
         banner.setVisible(False)
         
         banner_layout = QtWidgets.QHBoxLayout(banner)
         
         icon_label = QtWidgets.QLabel("⚠️")
-        icon_label.setStyleSheet("font-size: 24px;")
+        icon_label.setObjectName("captchaIcon")
         banner_layout.addWidget(icon_label)
         
         self.captcha_label = QtWidgets.QLabel("CAPTCHA detected. Please solve it in the browser.")
@@ -210,11 +367,12 @@ class MainWindow(QtWidgets.QMainWindow):
         banner_layout.addWidget(self.captcha_label, 1)
         
         self.captcha_resume_btn = QtWidgets.QPushButton("✓ Resume")
-        self.captcha_resume_btn.clicked.connect(self._on_captcha_resume)
+        # Button and slot both live on the UI thread; connect directly
+        self.captcha_resume_btn.clicked.connect(self._on_captcha_resume, QtCore.Qt.DirectConnection)
         banner_layout.addWidget(self.captcha_resume_btn)
         
         self.captcha_cancel_btn = QtWidgets.QPushButton("✗ Cancel")
-        self.captcha_cancel_btn.clicked.connect(self._on_captcha_cancel)
+        self.captcha_cancel_btn.clicked.connect(self._on_captcha_cancel, QtCore.Qt.DirectConnection)
         banner_layout.addWidget(self.captcha_cancel_btn)
         
         return banner
@@ -226,7 +384,7 @@ class MainWindow(QtWidgets.QMainWindow):
         
         # Page title
         title = QtWidgets.QLabel("📊 Dashboard")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; padding: 15px;")
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
         
         # Stats cards
@@ -252,17 +410,20 @@ class MainWindow(QtWidgets.QMainWindow):
         
         start_btn = QtWidgets.QPushButton("▶️ Start Job Search")
         start_btn.setMinimumHeight(50)
-        start_btn.clicked.connect(lambda: self._switch_page("Jobs"))
+        start_btn.setProperty("page", "Jobs")
+        start_btn.clicked.connect(self._nav_clicked)
         actions_layout.addWidget(start_btn)
         
         config_btn = QtWidgets.QPushButton("⚙️ Configure Settings")
         config_btn.setMinimumHeight(50)
-        config_btn.clicked.connect(lambda: self._switch_page("Settings"))
+        config_btn.setProperty("page", "Settings")
+        config_btn.clicked.connect(self._nav_clicked)
         actions_layout.addWidget(config_btn)
         
         history_btn = QtWidgets.QPushButton("📜 View History")
         history_btn.setMinimumHeight(50)
-        history_btn.clicked.connect(lambda: self._switch_page("History"))
+        history_btn.setProperty("page", "History")
+        history_btn.clicked.connect(self._nav_clicked)
         actions_layout.addWidget(history_btn)
         
         layout.addWidget(actions_group)
@@ -271,8 +432,11 @@ class MainWindow(QtWidgets.QMainWindow):
         recent_group = QtWidgets.QGroupBox("Recent Activity")
         recent_layout = QtWidgets.QVBoxLayout(recent_group)
         
-        self.recent_list = QtWidgets.QListWidget()
-        self.recent_list.addItem("No recent activity")
+        self.recent_model = QtCore.QStringListModel(list(self._recent) or ["No recent activity"])
+        self.recent_list = QtWidgets.QListView()
+        self.recent_list.setModel(self.recent_model)
+        self.recent_list.setUniformItemSizes(True)
+        self.recent_list.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         recent_layout.addWidget(self.recent_list)
         
         layout.addWidget(recent_group)
@@ -285,27 +449,20 @@ class MainWindow(QtWidgets.QMainWindow):
         """Create a statistics card widget"""
         card = QtWidgets.QFrame()
         card.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        card.setStyleSheet("""
-            QFrame {
-                background-color: #ecf0f1;
-                border: 1px solid #bdc3c7;
-                border-radius: 8px;
-                padding: 15px;
-            }
-        """)
+        card.setObjectName("statCard")
         
         card_layout = QtWidgets.QVBoxLayout(card)
         
         title_label = QtWidgets.QLabel(title)
-        title_label.setStyleSheet("font-size: 14px; color: #7f8c8d;")
+        title_label.setObjectName("statTitle")
         card_layout.addWidget(title_label)
         
         value_label = QtWidgets.QLabel(value)
-        value_label.setStyleSheet("font-size: 36px; font-weight: bold; color: #2c3e50;")
+        value_label.setObjectName("statValue")
         card_layout.addWidget(value_label)
         
         desc_label = QtWidgets.QLabel(description)
-        desc_label.setStyleSheet("font-size: 11px; color: #95a5a6;")
+        desc_label.setObjectName("statDescription")
         desc_label.setWordWrap(True)
         card_layout.addWidget(desc_label)
         
@@ -318,7 +475,7 @@ class MainWindow(QtWidgets.QMainWindow):
         
         # Page title
         title = QtWidgets.QLabel("💼 Job Search & Apply")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; padding: 15px;")
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
         
         # Control buttons
@@ -351,12 +508,14 @@ class MainWindow(QtWidgets.QMainWindow):
         form_layout.addWidget(QtWidgets.QLabel("Keywords:"), row, 0)
         self.keywords_edit = QtWidgets.QLineEdit()
         self.keywords_edit.setPlaceholderText("e.g., Python Developer, Data Scientist")
+        self.keywords_edit.editingFinished.connect(self._strip_line_edit)
         form_layout.addWidget(self.keywords_edit, row, 1)
         
         row += 1
         form_layout.addWidget(QtWidgets.QLabel("Location:"), row, 0)
         self.location_edit = QtWidgets.QLineEdit()
         self.location_edit.setPlaceholderText("e.g., United States, Remote")
+        self.location_edit.editingFinished.connect(self._strip_line_edit)
         form_layout.addWidget(self.location_edit, row, 1)
         
         row += 1
@@ -391,10 +550,10 @@ class MainWindow(QtWidgets.QMainWindow):
         
         # Stats
         stats_layout = QtWidgets.QHBoxLayout()
-        self.applied_label = QtWidgets.QLabel("✅ Applied: 0")
-        self.failed_label = QtWidgets.QLabel("❌ Failed: 0")
-        self.skipped_label = QtWidgets.QLabel("⏭️ Skipped: 0")
-        self.current_job_label = QtWidgets.QLabel("📌 Current: —")
+        self.applied_label = QtWidgets.QLabel(_fmt_applied(0))
+        self.failed_label = QtWidgets.QLabel(_fmt_failed(0))
+        self.skipped_label = QtWidgets.QLabel(_fmt_skipped(0))
+        self.current_job_label = QtWidgets.QLabel(_fmt_current("—"))
         
         stats_layout.addWidget(self.applied_label)
         stats_layout.addWidget(self.failed_label)
@@ -432,17 +591,16 @@ class MainWindow(QtWidgets.QMainWindow):
         layout = QtWidgets.QVBoxLayout(page)
         
         title = QtWidgets.QLabel("📋 Application Queue")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; padding: 15px;")
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
         
         info = QtWidgets.QLabel("View and manage pending job applications")
-        info.setStyleSheet("color: #7f8c8d; padding: 0 15px;")
+        info.setObjectName("pageInfo")
         layout.addWidget(info)
         
         # Queue table
-        self.queue_table = QtWidgets.QTableWidget(0, 5)
-        self.queue_table.setHorizontalHeaderLabels(["Job Title", "Company", "Location", "Status", "Actions"])
-        self.queue_table.horizontalHeader().setStretchLastSection(True)
+        self.queue_model = _RowTableModel(["Job Title", "Company", "Location", "Status", "Actions"], self)
+        self.queue_table = self._create_row_table(self.queue_model)
         layout.addWidget(self.queue_table)
         
         # Queue controls
@@ -467,11 +625,11 @@ class MainWindow(QtWidgets.QMainWindow):
         layout = QtWidgets.QVBoxLayout(page)
         
         title = QtWidgets.QLabel("📜 Application History")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; padding: 15px;")
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
         
         info = QtWidgets.QLabel("Review all past job applications")
-        info.setStyleSheet("color: #7f8c8d; padding: 0 15px;")
+        info.setObjectName("pageInfo")
         layout.addWidget(info)
         
         # Filter controls
@@ -495,9 +653,8 @@ class MainWindow(QtWidgets.QMainWindow):
         layout.addLayout(filter_layout)
         
         # History table
-        self.history_table = QtWidgets.QTableWidget(0, 6)
-        self.history_table.setHorizontalHeaderLabels(["Date", "Job Title", "Company", "Location", "Status", "Notes"])
-        self.history_table.horizontalHeader().setStretchLastSection(True)
+        self.history_model = _RowTableModel(["Date", "Job Title", "Company", "Location", "Status", "Notes"], self)
+        self.history_table = self._create_row_table(self.history_model)
         layout.addWidget(self.history_table)
         
         # History controls
@@ -520,18 +677,29 @@ class MainWindow(QtWidgets.QMainWindow):
         
         return page
 
+    def _create_row_table(self, model):
+        """Create a read-only table view with fixed-height rows over a _RowTableModel"""
+        table = QtWidgets.QTableView()
+        table.setModel(model)
+        table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        table.horizontalHeader().setStretchLastSection(True)
+        # Fixed row heights let the view skip per-row size hints on insert
+        table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        return table
+
     def _create_ai_page(self):
         """AI configuration page"""
         page = QtWidgets.QWidget()
         layout = QtWidgets.QVBoxLayout(page)
         
         title = QtWidgets.QLabel("🤖 AI Configuration")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; padding: 15px;")
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
         
         info = QtWidgets.QLabel("Configure AI providers for intelligent job matching and question answering")
-        info.setStyleSheet("color: #7f8c8d; padding: 0 15px; margin-bottom: 15px;")
+        info.setObjectName("pageInfo")
         layout.addWidget(info)
+        layout.addSpacing(15)
         
         # AI settings form
         ai_form = QtWidgets.QGroupBox("AI Provider Settings")
@@ -547,6 +715,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.api_key_edit = QtWidgets.QLineEdit()
         self.api_key_edit.setEchoMode(QtWidgets.QLineEdit.Password)
         self.api_key_edit.setPlaceholderText("Enter your API key")
+        self.api_key_edit.editingFinished.connect(self._strip_line_edit)
         form_layout.addRow("API Key:", self.api_key_edit)
         
         show_key_btn = QtWidgets.QPushButton("👁️ Show")
@@ -585,9 +754,9 @@ class MainWindow(QtWidgets.QMainWindow):
         layout.addWidget(save_ai_btn)
         
         # Test button
-        test_ai_btn = QtWidgets.QPushButton("🧪 Test AI Connection")
-        test_ai_btn.clicked.connect(self._test_ai_connection)
-        layout.addWidget(test_ai_btn)
+        self.test_ai_btn = QtWidgets.QPushButton("🧪 Test AI Connection")
+        self.test_ai_btn.clicked.connect(self._test_ai_connection)
+        layout.addWidget(self.test_ai_btn)
         
         layout.addStretch()
         
@@ -599,7 +768,7 @@ class MainWindow(QtWidgets.QMainWindow):
         layout = QtWidgets.QVBoxLayout(page)
         
         title = QtWidgets.QLabel("⚙️ Application Settings")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; padding: 15px;")
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
         
         # Settings tabs
@@ -631,6 +800,7 @@ class MainWindow(QtWidgets.QMainWindow):
         
         self.username_edit = QtWidgets.QLineEdit()
         self.username_edit.setPlaceholderText("your.email@example.com")
+        self.username_edit.editingFinished.connect(self._strip_line_edit)
         linkedin_layout.addRow("LinkedIn Email:", self.username_edit)
         
         self.password_edit = QtWidgets.QLineEdit()
@@ -677,9 +847,9 @@ class MainWindow(QtWidgets.QMainWindow):
         load_btn.clicked.connect(self._load_settings)
         buttons_layout.addWidget(load_btn)
         
-        save_btn = QtWidgets.QPushButton("💾 Save to Files")
-        save_btn.clicked.connect(self._save_settings)
-        buttons_layout.addWidget(save_btn)
+        self.save_btn = QtWidgets.QPushButton("💾 Save to Files")
+        self.save_btn.clicked.connect(self._save_settings)
+        buttons_layout.addWidget(self.save_btn)
         
         reset_btn = QtWidgets.QPushButton("🔄 Reset to Defaults")
         reset_btn.clicked.connect(self._reset_settings)
@@ -694,7 +864,7 @@ class MainWindow(QtWidgets.QMainWindow):
             "• config/search.py - Job search settings\n"
             "• config/settings.py - Application settings"
         )
-        config_info.setStyleSheet("color: #7f8c8d; padding: 15px; font-size: 11px;")
+        config_info.setObjectName("configInfo")
         layout.addWidget(config_info)
         
         layout.addStretch()
@@ -710,41 +880,137 @@ class MainWindow(QtWidgets.QMainWindow):
         self.connection_label = QtWidgets.QLabel("🔴 Automation: Idle")
         self.statusBar().addWidget(self.connection_label)
 
+    def _ensure_page(self, page_name):
+        """Build a page the first time it is needed, replacing its placeholder"""
+        if page_name in self._page_built:
+            return
+        index = self._page_index[page_name]
+        page = self._page_factories[page_name]()
+        placeholder = self.pages.widget(index)
+        self.pages.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.pages.insertWidget(index, page)
+        self._page_built.add(page_name)
+
+    def _build_remaining_pages(self):
+        """Build one not-yet-visited page per event loop tick until all exist"""
+        for name in self._page_factories:
+            if name not in self._page_built:
+                self._ensure_page(name)
+                QtCore.QTimer.singleShot(0, self._build_remaining_pages)
+                return
+
+    def _nav_id_clicked(self, nav_id):
+        """Switch to the page behind the clicked nav rail button"""
+        self._switch_page(_NAV_ITEMS[nav_id][0])
+
+    def _nav_clicked(self):
+        """Switch to the page named by the clicked button's "page" property"""
+        self._switch_page(self.sender().property("page"))
+
     def _switch_page(self, page_name):
         """Switch to a different page"""
-        page_index = {
-            "Dashboard": 0,
-            "Jobs": 1,
-            "Queue": 2,
-            "History": 3,
-            "AI": 4,
-            "Settings": 5
-        }.get(page_name, 0)
-        
-        self.pages.setCurrentIndex(page_index)
+        if page_name not in self._page_index:
+            page_name = "Dashboard"
+        self._ensure_page(page_name)
+
+        self.pages.setCurrentIndex(self._page_index[page_name])
         self.current_page = page_name
         self.statusbar_label.setText(f"View: {page_name}")
+        if page_name == "Jobs":
+            self._poll_worker_progress()
         
-        # Update navigation buttons
-        for name, btn in self.nav_buttons.items():
-            btn.setChecked(name == page_name)
+        # The exclusive nav group unchecks the previous button
+        self.nav_buttons[page_name].setChecked(True)
         
         self._log("info", f"Switched to {page_name}")
 
     def _log(self, level, message):
-        """Add message to log"""
-        timestamp = QtCore.QTime.currentTime().toString("HH:mm:ss")
-        color_map = {
-            "info": "#3498db",
-            "success": "#27ae60",
-            "warning": "#f39c12",
-            "error": "#e74c3c",
-            "debug": "#95a5a6"
-        }
-        color = color_map.get(level, "#000000")
-        
-        formatted_msg = f'<span style="color: {color};">[{timestamp}] [{level.upper()}] {message}</span>'
-        self.log_text.append(formatted_msg)
+        """Queue a message for the log; it is written on the next flush"""
+        timestamp = self._timestamp()
+        prefix = _LEVEL_PREFIX.get(level) or f" [{level.upper()}] "
+        self._log_buf.append((level, f"[{timestamp}]{prefix}{message}"))
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _timestamp(self):
+        """Current HH:MM:SS, reformatted only when the wall-clock second changes"""
+        now = int(time.time())
+        if now != self._ts_second:
+            self._ts_second = now
+            self._ts_cached = time.strftime("%H:%M:%S", time.localtime(now))
+        return self._ts_cached
+
+    def _flush_log(self):
+        """Append all buffered log lines with a single document update"""
+        if not self._log_buf:
+            return
+        scrollbar = self.log_text.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        
+        # One block per line so the block limit trims whole lines
+        cursor = QtGui.QTextCursor(self.log_text.document())
+        cursor.movePosition(QtGui.QTextCursor.End)
+        cursor.beginEditBlock()
+        # Consecutive lines of the same level share a format, so insert them in one call
+        sep = "" if cursor.atStart() else "\n"
+        run_level, run = None, []
+        for level, line in self._log_buf:
+            if level != run_level and run:
+                cursor.insertText(sep + "\n".join(run), self._fmt_by_level.get(run_level, self._fmt_default))
+                sep, run = "\n", []
+            run_level = level
+            run.append(line)
+        cursor.insertText(sep + "\n".join(run), self._fmt_by_level.get(run_level, self._fmt_default))
+        cursor.endEditBlock()
+        self._log_buf.clear()
+        
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def add_recent(self, text):
+        """Prepend an entry to the dashboard's recent activity feed"""
+        self._recent.appendleft(f"{time.strftime('%H:%M')}  {text}")
+        self.recent_model.setStringList(list(self._recent))
+
+    def _show_info(self, title, text):
+        """Show a modal information message, reusing one QMessageBox"""
+        if self._info_box is None:
+            self._info_box = QtWidgets.QMessageBox(self)
+            self._info_box.setIcon(QtWidgets.QMessageBox.Information)
+        self._info_box.setWindowTitle(title)
+        self._info_box.setText(text)
+        self._info_box.exec()
+
+    def _confirm(self, title, text):
+        """Ask a Yes/No question, reusing one QMessageBox; True if Yes was chosen"""
+        if self._confirm_box is None:
+            self._confirm_box = QtWidgets.QMessageBox(
+                QtWidgets.QMessageBox.Question, "", "",
+                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No, self
+            )
+        self._confirm_box.setWindowTitle(title)
+        self._confirm_box.setText(text)
+        return self._confirm_box.exec() == QtWidgets.QMessageBox.Yes
+
+    def _strip_line_edit(self):
+        """Trim surrounding whitespace once, when the user leaves the field"""
+        edit = self.sender()
+        text = edit.text()
+        stripped = text.strip()
+        if stripped != text:
+            edit.setText(stripped)
+
+    def _run_in_background(self, fn, on_done, on_failed):
+        """Run fn on the thread pool; on_done/on_failed are called back on the UI thread"""
+        task = _BackgroundTask(fn)
+        # Keep the signals object alive until one of its slots has run
+        self._bg_tasks.add(task.signals)
+        task.signals.done.connect(on_done)
+        task.signals.failed.connect(on_failed)
+        task.signals.done.connect(lambda _: self._bg_tasks.discard(task.signals))
+        task.signals.failed.connect(lambda _: self._bg_tasks.discard(task.signals))
+        QtCore.QThreadPool.globalInstance().start(task)
 
     # Button handlers
     def _on_run(self):
@@ -756,9 +1022,7 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.warning(self, "Missing Keywords", "Please enter job keywords to search for.")
             return
         
-        self.run_btn.setEnabled(False)
-        self.pause_btn.setEnabled(True)
-        self.stop_btn.setEnabled(True)
+        self._set_run_state("running")
         
         self._log("info", f"Starting job search: {keywords} in {location}")
         self._on_search()
@@ -766,33 +1030,49 @@ class MainWindow(QtWidgets.QMainWindow):
     def _on_pause(self):
         """Pause automation"""
         self._log("warning", "Automation paused")
-        self.run_btn.setEnabled(True)
-        self.pause_btn.setEnabled(False)
+        self._set_run_state("paused")
 
     def _on_stop(self):
         """Stop automation"""
         self._log("warning", "Stop requested")
-        
-        # Stop worker thread if running
-        if self.worker and self.worker.isRunning():
-            try:
-                self.worker.terminate()
-                self.worker.wait(2000)  # Wait up to 2 seconds
-            except Exception as e:
-                self._log("debug", f"Worker stop: {e}")
-        
-        # Close browser
-        try:
-            from modules.open_chrome import close_browser
-            close_browser()
-            self._log("info", "Browser closed")
-        except Exception as e:
-            self._log("debug", f"Browser close: {e}")
-        
-        self.run_btn.setEnabled(True)
-        self.pause_btn.setEnabled(False)
-        self.stop_btn.setEnabled(False)
-        self.connection_label.setText("🔴 Automation: Idle")
+        self._set_run_state("stopping")
+        
+        # Ask the worker to wind down and poll for it instead of blocking here
+        if self.worker and self.worker.is_running():
+            self.worker.stop()
+            self._stop_polls = 0
+            QtCore.QTimer.singleShot(self.STOP_POLL_MS, self._poll_worker_stopped)
+        else:
+            self._finish_stop()
+
+    def _poll_worker_stopped(self):
+        """Re-check the worker until it exits or the stop grace period runs out"""
+        if self.worker and self.worker.is_running() and self._stop_polls < self.STOP_MAX_POLLS:
+            self._stop_polls += 1
+            QtCore.QTimer.singleShot(self.STOP_POLL_MS, self._poll_worker_stopped)
+            return
+        self._finish_stop()
+
+    def _finish_stop(self):
+        """Close the browser off the UI thread and return the controls to idle"""
+        # Closing the browser also unblocks a worker still stuck in a Selenium call
+        self._run_in_background(
+            lambda: _lazy_module("modules.open_chrome").close_browser(),
+            lambda _: self._log("info", "Browser closed"),
+            lambda e: self._log("debug", f"Browser close: {e}"),
+        )
+        self._set_run_state("idle")
+
+    def _set_run_state(self, state):
+        """Update the run controls and status bar; a no-op if already in that state"""
+        if state == self._run_state:
+            return
+        self._run_state = state
+        run, pause, stop, status = _RUN_STATES[state]
+        self.run_btn.setEnabled(run)
+        self.pause_btn.setEnabled(pause)
+        self.stop_btn.setEnabled(stop)
+        self.connection_label.setText(status)
 
     def _on_search(self):
         """Start the automation worker"""
@@ -806,7 +1086,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._log("info", f"Search: {keywords} | Location: {location} | Max: {max_apps}")
 
         # Start background worker
-        if self.worker and self.worker.isRunning():
+        if self.worker and self.worker.is_running():
             self._log("warning", "Automation already running")
             return
 
@@ -821,46 +1101,105 @@ class MainWindow(QtWidgets.QMainWindow):
                 prefer_english=prefer_english
             )
             
-            self.worker.log_signal.connect(lambda lvl, msg: self._log(lvl, msg))
-            self.worker.progress_signal.connect(self._on_worker_progress)
-            self.worker.form_progress_signal.connect(self._on_form_progress)
-            self.worker.finished_signal.connect(self._on_worker_finished)
-            self.worker.captcha_pause_signal.connect(self._on_captcha_detected)
-            self.worker.start()
-            
-            self.connection_label.setText("🟢 Automation: Running")
+            # Signals are emitted from the pool thread; queue them onto the UI thread
+            signals = self.worker.signals
+            queued = QtCore.Qt.QueuedConnection
+            signals.finished_signal.connect(self._on_worker_finished, queued)
+            signals.captcha_pause_signal.connect(self._on_captcha_detected, queued)
+            signals.logs_ready.connect(self._on_worker_logs_ready, queued)
+            self.worker.start(self._automation_pool)
+            self._progress_divisor = 100.0 / max_apps if max_apps else 0.0
+            self._shown_progress = None
+            self._shown_counts = None
+            self._shown_job = None
+            self._progress_timer.start()
             
         except Exception as e:
             self._log("error", f"Failed to start worker: {e}")
+            self._set_run_state("idle")
+
+    def _on_worker_logs_ready(self):
+        """Schedule a drain; lines arriving before it fires join the same batch"""
+        if not self._worker_log_timer.isActive():
+            self._worker_log_timer.start()
+
+    def _drain_worker_logs(self):
+        """Move the worker's buffered log lines into the activity log in one flush"""
+        if not self.worker:
+            return
+        lines = self.worker.drain_logs()
+        if not lines:
+            return
+        # Inline _log for the batch: one timestamp, and no flush timer since we flush now
+        stamp = f"[{self._timestamp()}]"
+        append = self._log_buf.append
+        prefix_for = _LEVEL_PREFIX.get
+        for level, message in lines:
+            prefix = prefix_for(level) or f" [{level.upper()}] "
+            append((level, f"{stamp}{prefix}{message}"))
+        self._flush_log()
+
+    def _poll_worker_progress(self, force=False):
+        """Show the worker's latest progress snapshot if it changed since the last tick"""
+        # The progress widgets live on the Jobs page; _switch_page catches up on return.
+        # force is for the final poll, which must land even if the user is elsewhere
+        if not self.worker or (self.current_page != "Jobs" and not force):
+            return
+        latest = self.worker.latest_progress
+        if latest is not None and latest != self._shown_progress:
+            self._shown_progress = latest
+            self._on_worker_progress(*latest)
+        form_pct = self.worker.latest_form_pct
+        if form_pct >= 0 and form_pct != self._shown_form_pct:
+            self._on_form_progress(form_pct)
 
     def _on_worker_progress(self, applied, failed, skipped, current_job):
         """Update progress display"""
-        self.applied_label.setText(f"✅ Applied: {applied}")
-        self.failed_label.setText(f"❌ Failed: {failed}")
-        self.skipped_label.setText(f"⏭️ Skipped: {skipped}")
-        self.current_job_label.setText(f"📌 Current: {current_job[:40]}")
+        if current_job != self._shown_job:
+            self._shown_job = current_job
+            self.current_job_label.setText(_fmt_current(current_job))
+        
+        # The counters and bar only move when a job is finished, not per title change
+        counts = (applied, failed, skipped)
+        if counts == self._shown_counts:
+            return
+        self._shown_counts = counts
+        self.applied_label.setText(_fmt_applied(applied))
+        self.failed_label.setText(_fmt_failed(failed))
+        self.skipped_label.setText(_fmt_skipped(skipped))
         
         total = applied + failed + skipped
         if total > 0:
-            progress = min(int((total / self.max_apply_spin.value()) * 100), 99)
-            self.overall_progress.setValue(progress)
+            progress = min(int(total * self._progress_divisor), 99)
+            if self.overall_progress.value() != progress:
+                self.overall_progress.setValue(progress)
 
     def _on_form_progress(self, percent):
         """Update form fill progress"""
+        self._shown_form_pct = percent
         self.form_progress.setValue(percent)
 
-    def _on_worker_finished(self, stats):
+    def _on_worker_finished(self, applied, failed, skipped, error):
         """Handle worker completion"""
-        self._log("success", f"Automation finished: {stats}")
+        self._drain_worker_logs()
+        self._worker_log_timer.stop()
+        # Show the final counts now so a later _switch_page("Jobs") has nothing to
+        # catch up on and can't pull the finished bar back to 99
+        self._poll_worker_progress(force=True)
+        self._progress_timer.stop()
+        if error:
+            self._log("error", f"Automation failed: {error}")
+            self.add_recent(f"Run failed: {error}")
+        else:
+            summary = f"{applied} applied, {failed} failed, {skipped} skipped"
+            self._log("success", f"Automation finished: {summary}")
+            self.add_recent(f"Run finished: {summary}")
         self.overall_progress.setValue(100)
-        self.connection_label.setText("🔴 Automation: Idle")
-        
-        self.run_btn.setEnabled(True)
-        self.pause_btn.setEnabled(False)
-        self.stop_btn.setEnabled(False)
+        self._set_run_state("idle")
 
     def _on_captcha_detected(self, message):
         """Show CAPTCHA banner when detected"""
+        message = message or "CAPTCHA detected"
         self.captcha_label.setText(message)
         self.captcha_banner.setVisible(True)
         self._log("warning", message)
@@ -869,6 +1208,12 @@ class MainWindow(QtWidgets.QMainWindow):
         """Resume after CAPTCHA"""
         self.captcha_banner.setVisible(False)
         self._log("info", "Resuming after CAPTCHA")
+        if self.worker:
+            self._run_in_background(
+                self.worker.resume_after_captcha,
+                lambda _: None,
+                lambda e: self._log("error", f"CAPTCHA resume failed: {e}"),
+            )
 
     def _on_captcha_cancel(self):
         """Cancel after CAPTCHA"""
@@ -892,14 +1237,14 @@ class MainWindow(QtWidgets.QMainWindow):
             model = self.model_combo.currentText()
             
             # Update config/secrets.py
-            import Auto_job_applier_linkedIn.config.secrets as secrets
+            secrets = _lazy_module("Auto_job_applier_linkedIn.config.secrets")
             secrets.use_AI = use_ai
             secrets.ai_provider = provider
             secrets.llm_api_key = api_key if api_key else "not-needed"
             secrets.llm_model = model
             
             # Reinitialize AI handler with new config
-            from modules.ai_handler import ai_handler
+            ai_handler = _lazy_module("modules.ai_handler").ai_handler
             ai_handler.enabled = use_ai
             ai_handler.provider = provider
             ai_handler.api_key = api_key if api_key else "not-needed"
@@ -907,8 +1252,8 @@ class MainWindow(QtWidgets.QMainWindow):
             ai_handler._initialize_client()
             
             self._log("success", f"AI configuration saved (Provider: {provider}, Enabled: {use_ai})")
-            QtWidgets.QMessageBox.information(
-                self, "Saved", 
+            self._show_info(
+                "Saved",
                 f"AI configuration saved successfully!\n\n"
                 f"Provider: {provider}\n"
                 f"Model: {model}\n"
@@ -924,50 +1269,7 @@ class MainWindow(QtWidgets.QMainWindow):
         
         try:
             # Import AI handler
-            from modules.ai_handler import test_ai_connection
-            
-            # Show progress dialog
-            progress = QtWidgets.QProgressDialog("Testing AI connection...", "Cancel", 0, 0, self)
-            progress.setWindowModality(QtCore.Qt.WindowModal)
-            progress.setMinimumDuration(0)
-            progress.setValue(0)
-            progress.show()
-            QtWidgets.QApplication.processEvents()
-            
-            # Test connection
-            result = test_ai_connection()
-            
-            progress.close()
-            
-            # Show results
-            if result["success"]:
-                self._log("success", "AI connection successful!")
-                details = result.get("details", {})
-                msg = f"✅ Connection Successful!\n\n"
-                msg += f"Provider: {details.get('provider', 'unknown')}\n"
-                msg += f"Model: {details.get('model', 'unknown')}\n"
-                msg += f"API URL: {details.get('api_url', 'N/A')}\n\n"
-                msg += f"Response: {details.get('response', 'OK')}"
-                
-                QtWidgets.QMessageBox.information(self, "AI Test Success", msg)
-            else:
-                self._log("error", f"AI connection failed: {result['message']}")
-                details = result.get("details", {})
-                msg = f"❌ Connection Failed\n\n"
-                msg += f"Error: {result['message']}\n\n"
-                msg += f"Provider: {details.get('provider', 'unknown')}\n"
-                
-                if details.get('error_type'):
-                    msg += f"Error Type: {details['error_type']}\n"
-                
-                msg += f"\n💡 Troubleshooting:\n"
-                msg += f"1. Check your API key is valid\n"
-                msg += f"2. Verify internet connection\n"
-                msg += f"3. Ensure API URL is correct\n"
-                msg += f"4. Check API service status\n"
-                
-                QtWidgets.QMessageBox.warning(self, "AI Test Failed", msg)
-                
+            test_ai_connection = _lazy_module("modules.ai_handler").test_ai_connection
         except ImportError as e:
             self._log("error", f"AI module import error: {str(e)}")
             QtWidgets.QMessageBox.critical(
@@ -976,50 +1278,163 @@ class MainWindow(QtWidgets.QMainWindow):
                 f"Make sure required packages are installed:\n"
                 f"pip install openai google-generativeai"
             )
-        except Exception as e:
-            self._log("error", f"AI test error: {str(e)}")
-            QtWidgets.QMessageBox.critical(
-                self, "Error",
-                f"An error occurred while testing AI:\n{str(e)}"
-            )
+            return
+        
+        # Show progress dialog while the request runs on the thread pool. The request
+        # can't be aborted, so there is no Cancel button, and Test stays disabled
+        # until the result is in so a second test can't replace this dialog
+        self.test_ai_btn.setEnabled(False)
+        self._ai_test_progress = QtWidgets.QProgressDialog("Testing AI connection...", None, 0, 0, self)
+        self._ai_test_progress.setCancelButton(None)
+        self._ai_test_progress.setWindowModality(QtCore.Qt.WindowModal)
+        self._ai_test_progress.setMinimumDuration(0)
+        self._ai_test_progress.setValue(0)
+        self._ai_test_progress.show()
+        
+        self._run_in_background(test_ai_connection, self._on_ai_test_done, self._on_ai_test_failed)
+
+    def _on_ai_test_done(self, result):
+        """Show the result of the AI connection test"""
+        self._ai_test_progress.close()
+        self.test_ai_btn.setEnabled(True)
+        
+        if result["success"]:
+            self._log("success", "AI connection successful!")
+            details = result.get("details", {})
+            msg = f"✅ Connection Successful!\n\n"
+            msg += f"Provider: {details.get('provider', 'unknown')}\n"
+            msg += f"Model: {details.get('model', 'unknown')}\n"
+            msg += f"API URL: {details.get('api_url', 'N/A')}\n\n"
+            msg += f"Response: {details.get('response', 'OK')}"
+            
+            self._show_info("AI Test Success", msg)
+        else:
+            self._log("error", f"AI connection failed: {result['message']}")
+            details = result.get("details", {})
+            msg = f"❌ Connection Failed\n\n"
+            msg += f"Error: {result['message']}\n\n"
+            msg += f"Provider: {details.get('provider', 'unknown')}\n"
+            
+            if details.get('error_type'):
+                msg += f"Error Type: {details['error_type']}\n"
+            
+            msg += f"\n💡 Troubleshooting:\n"
+            msg += f"1. Check your API key is valid\n"
+            msg += f"2. Verify internet connection\n"
+            msg += f"3. Ensure API URL is correct\n"
+            msg += f"4. Check API service status\n"
+            
+            QtWidgets.QMessageBox.warning(self, "AI Test Failed", msg)
+
+    def _on_ai_test_failed(self, error):
+        """Report an exception raised by the AI connection test"""
+        self._ai_test_progress.close()
+        self.test_ai_btn.setEnabled(True)
+        self._log("error", f"AI test error: {str(error)}")
+        QtWidgets.QMessageBox.critical(
+            self, "Error",
+            f"An error occurred while testing AI:\n{str(error)}"
+        )
 
     def _save_settings(self):
-        """Save settings to config files"""
+        """Save the job search criteria to config/search.py"""
+        self._ensure_page("Jobs")
+        keywords = self.keywords_edit.text()
+        updates = {
+            "search_terms": [k.strip() for k in keywords.split(",") if k.strip()],
+            "search_location": self.location_edit.text(),
+            "preferred_language": self.language_combo.currentText(),
+            "prefer_english_first": self.pref_english_chk.isChecked(),
+            "easy_apply_only": self.easy_apply_chk.isChecked(),
+        }
+
+        # The file write runs on the thread pool; the result comes back as a callback.
+        # save_search_settings compares against the file itself and skips no-op writes.
+        # Save stays disabled until then so two clicks can't race on the file
+        self.save_btn.setEnabled(False)
+        self._run_in_background(
+            lambda: _lazy_module("modules.settings_manager").save_search_settings(updates),
+            self._on_settings_saved,
+            self._on_settings_save_failed,
+        )
+
+    def _on_settings_saved(self, written):
+        """Report a successful settings save; written is False if the file already matched"""
+        self.save_btn.setEnabled(True)
+        if not written:
+            self._log("info", "Settings unchanged - nothing to save")
+            self._show_info("Saved", "Settings are already up to date.")
+            return
         self._log("success", "Settings saved to config files")
-        QtWidgets.QMessageBox.information(self, "Saved", "Settings saved successfully!")
+        self._show_info("Saved", "Settings saved successfully!")
+
+    def _on_settings_save_failed(self, error):
+        """Report a failed settings save"""
+        self.save_btn.setEnabled(True)
+        self._log("error", f"Error saving settings: {error}")
+        QtWidgets.QMessageBox.critical(self, "Error", f"Failed to save settings:\n{error}")
 
     def _load_settings(self):
-        """Load settings from config files"""
+        """Load the job search criteria from config/search.py"""
+        try:
+            settings = _lazy_module("modules.settings_manager").load_search_settings()
+        except Exception as e:
+            self._log("error", f"Error loading settings: {e}")
+            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to load settings:\n{e}")
+            return
+
+        self._ensure_page("Jobs")
+
+        terms = settings.get("search_terms", [])
+        if isinstance(terms, (list, tuple)):
+            terms = ", ".join(str(t) for t in terms)
+        assignments = (
+            (self.keywords_edit, self.keywords_edit.setText, str(terms)),
+            (self.location_edit, self.location_edit.setText, str(settings.get("search_location", ""))),
+            (self.language_combo, self.language_combo.setCurrentText, str(settings.get("preferred_language", ""))),
+            (self.pref_english_chk, self.pref_english_chk.setChecked, bool(settings.get("prefer_english_first", True))),
+            (self.easy_apply_chk, self.easy_apply_chk.setChecked, bool(settings.get("easy_apply_only", True))),
+        )
+
+        # Apply all values as one batch: no per-widget change signals or repaints
+        form = self.keywords_edit.parentWidget()
+        form.setUpdatesEnabled(False)
+        for widget, _, _ in assignments:
+            widget.blockSignals(True)
+        try:
+            for _, setter, value in assignments:
+                setter(value)
+        finally:
+            for widget, _, _ in assignments:
+                widget.blockSignals(False)
+            form.setUpdatesEnabled(True)
+
         self._log("info", "Settings loaded from config files")
-        QtWidgets.QMessageBox.information(self, "Loaded", "Settings loaded successfully!")
+        self._show_info("Loaded", "Settings loaded successfully!")
 
     def _reset_settings(self):
         """Reset settings to defaults"""
-        reply = QtWidgets.QMessageBox.question(
-            self, "Reset Settings",
-            "Are you sure you want to reset all settings to defaults?",
-            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
-        )
-        
-        if reply == QtWidgets.QMessageBox.Yes:
+        if self._confirm("Reset Settings", "Are you sure you want to reset all settings to defaults?"):
             self._log("info", "Settings reset to defaults")
 
     def _confirm_clear_history(self):
         """Confirm clearing history"""
-        reply = QtWidgets.QMessageBox.question(
-            self, "Clear History",
-            "Are you sure you want to clear all application history?",
-            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
-        )
-        
-        if reply == QtWidgets.QMessageBox.Yes:
-            self.history_table.setRowCount(0)
+        if self._confirm("Clear History", "Are you sure you want to clear all application history?"):
+            self.history_model.clear()
             self._log("info", "History cleared")
 
     def _refresh_settings(self):
         """Refresh settings from files"""
         self._log("info", "Refreshing settings...")
 
+    def closeEvent(self, event):
+        """Stop the worker and detach it so it stops signalling into a closing window"""
+        if self.worker:
+            # The automation pool waits for its thread when it is destroyed
+            self.worker.stop()
+            self.worker.detach()
+        super().closeEvent(event)
+
     def _show_about(self):
         """Show about dialog"""
         QtWidgets.QMessageBox.about(
@@ -1032,18 +1447,101 @@ class MainWindow(QtWidgets.QMainWindow):
         )
 
 
-class AutomationWorker(QtCore.QThread):
-    """Background worker that runs the LinkedIn automation workflow."""
+class _RowTableModel(QtCore.QAbstractTableModel):
+    """Read-only table model over a list of row tuples, appended to in batches."""
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._rows = []
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and index.isValid():
+            row = self._rows[index.row()]
+            if index.column() < len(row):
+                return str(row[index.column()])
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def append_rows(self, rows):
+        """Append several rows with a single rowsInserted notification."""
+        rows = list(rows)
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def clear(self):
+        """Drop all rows."""
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+
+
+class _TaskSignals(QtCore.QObject):
+    """Signals for a _BackgroundTask (QRunnable itself cannot emit)."""
+
+    done = QtCore.Signal(object)  # return value of the task
+    failed = QtCore.Signal(object)  # exception raised by the task
+
+
+class _BackgroundTask(QtCore.QRunnable):
+    """Run a blocking call on the global thread pool and report back via signals."""
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.done.emit(result)
+
+
+class AutomationSignals(QtCore.QObject):
+    """Signals emitted by AutomationWorker (QRunnable itself cannot emit)."""
 
-    log_signal = QtCore.Signal(str, str)  # level, message
-    finished_signal = QtCore.Signal(dict)
-    progress_signal = QtCore.Signal(int, int, int, str)  # applied, failed, skipped, current_job
-    form_progress_signal = QtCore.Signal(int)  # form fill percentage (0-100)
+    finished_signal = QtCore.Signal(int, int, int, str)  # applied, failed, skipped, error
     captcha_pause_signal = QtCore.Signal(str)  # message when CAPTCHA pause required
+    logs_ready = QtCore.Signal()  # log buffer went from empty to non-empty
+
+
+class AutomationWorker(QtCore.QRunnable):
+    """Background task that runs the LinkedIn automation workflow on a thread pool."""
+
+    LOG_REPEAT_WINDOW_MS = 250
+
+    # Automation modules, imported on the first run and shared by later runs
+    _modules_lock = threading.Lock()
+    _chrome = None
+    _LinkedInSession = None
+    _error_recovery = None
 
     def __init__(self, job_title: str, location: str, max_applications: int, 
                  form_data: dict, language: str = "", prefer_english: bool = False):
         super().__init__()
+        # MainWindow keeps the reference; the pool must not delete it after run()
+        self.setAutoDelete(False)
+        self.signals = AutomationSignals()
+        # Bound once; the signals object lives as long as the worker
+        self._emit_captcha = self.signals.captcha_pause_signal.emit
+        self._emit_finished = self.signals.finished_signal.emit
         self.job_title = job_title
         self.location = location
         self.max_applications = max_applications
@@ -1051,17 +1549,168 @@ class AutomationWorker(QtCore.QThread):
         self.language = language
         self.prefer_english = prefer_english
 
+        # Cleared by MainWindow.closeEvent so late callbacks from the automation
+        # don't emit into a window whose C++ side is already gone.
+        self._alive = True
+
+        # Identical consecutive log lines arriving within LOG_REPEAT_WINDOW_MS
+        # are counted instead of emitted, then summarised as one "(×N)" line.
+        self._last_log = (None, None)
+        self._log_repeats = 0
+        self._log_clock = QtCore.QElapsedTimer()
+        # Log lines wait here until MainWindow drains them; oldest dropped past 5000
+        self._log_buf = collections.deque(maxlen=5000)
+        # emit_log has several producers: the worker thread, the UI thread (stop()
+        # logs "Cancellation requested" through request_cancel) and the background
+        # CAPTCHA resume. The lock guards the dedupe state and the append; the single
+        # consumer (UI) only pops, which is atomic on a deque. The flag makes sure one
+        # logs_ready is outstanding per drain.
+        self._log_lock = threading.Lock()
+        self._logs_signalled = False
+
+        self.session = None  # LinkedInSession, once run() has created it
+        self.recovery_manager = None  # ErrorRecoveryManager, once the CAPTCHA hook is installed
+        # (applied, failed, skipped, current_job[:40]), polled by MainWindow instead of
+        # signalled per job; a single attribute store is atomic under the GIL
+        self.latest_progress = None
+        self.latest_form_pct = -1  # form fill percentage, polled the same way
+        self._running = False
+        self._stop_requested = False
+
+    def start(self, pool):
+        """Submit the worker to pool; it counts as running from this point."""
+        self._running = True
+        pool.start(self)
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def stop(self):
+        """Ask the automation to wind down at its next cancellation point."""
+        self._stop_requested = True
+        session = self.session
+        if session is not None:
+            session.app_manager.request_cancel()
+
+    def detach(self):
+        """Stop emitting signals; the receiving window is closing."""
+        self._alive = False
+
+    def resume_after_captcha(self):
+        """Release a run blocked on a CAPTCHA; logs the event via the driver, so keep it off the UI thread."""
+        mgr = self.recovery_manager
+        if mgr is not None:
+            mgr.request_resume()
+
+    def _emit_log(self, level, message):
+        self._log_buf.append((level, message))
+        # Only the first line after a drain wakes the UI; the rest ride along
+        if not self._logs_signalled:
+            self._logs_signalled = True
+            self.signals.logs_ready.emit()
+
+    def drain_logs(self):
+        """Return and clear the buffered (level, message) pairs; called from the UI thread."""
+        # Re-arm before draining: a line appended after this point either gets
+        # drained below or sends a fresh logs_ready
+        self._logs_signalled = False
+        buf = self._log_buf
+        lines = []
+        while buf:
+            lines.append(buf.popleft())
+        return lines
+
     def emit_log(self, message: str, level: str = "info"):
-        try:
-            self.log_signal.emit(level, message)
-        except Exception:
-            pass
+        if not self._alive:
+            return
+        with self._log_lock:
+            if ((level, message) == self._last_log
+                    and self._log_clock.isValid()
+                    and self._log_clock.elapsed() < self.LOG_REPEAT_WINDOW_MS):
+                self._log_repeats += 1
+                self._log_clock.restart()
+                return
+            self._flush_log_repeats()
+            self._last_log = (level, message)
+            self._log_clock.restart()
+            self._emit_log(level, message)
+
+    def _finish(self, stats):
+        """Flush pending log repeats and report the run's statistics to the UI."""
+        with self._log_lock:
+            self._flush_log_repeats()
+        self._emit_finished(
+            stats.get("applied", 0), stats.get("failed", 0), stats.get("skipped", 0),
+            stats.get("error", ""),
+        )
+
+    def _flush_log_repeats(self):
+        """Emit the summary line for any suppressed duplicates; caller holds _log_lock."""
+        if self._log_repeats and self._alive:
+            level, message = self._last_log
+            self._emit_log(level, f"{message} (×{self._log_repeats})")
+        self._log_repeats = 0
 
     def run(self):
+        # Pool threads are reused; lower this one only while the automation runs.
+        # Selenium/AI work shares the GIL with the UI, so let the OS favour the UI thread.
+        thread = QtCore.QThread.currentThread()
+        priority = thread.priority()
+        if priority == QtCore.QThread.InheritPriority:
+            priority = QtCore.QThread.NormalPriority
+        thread.setPriority(QtCore.QThread.LowPriority)
         try:
-            # Import modules
+            self._run()
+        finally:
+            thread.setPriority(priority)
+            self._running = False
+
+    def _install_captcha_hook(self, mgr):
+        """Make an ErrorRecoveryManager block on CAPTCHAs and ask the UI for action."""
+        if mgr is None or not hasattr(mgr, 'config'):
+            return
+        cfg = mgr.config
+        cfg.captcha_blocking_wait = True
+        # The manager already substitutes a default message; emit straight into the queued signal
+        cfg.captcha_pause_callback = self._emit_captcha
+        # keep reference for debugging if needed
+        self.recovery_manager = mgr
+
+    def _on_progress(self, applied, failed, skipped, current_job):
+        """Session callback after each job; MainWindow polls latest_progress."""
+        # Truncate here so the UI thread only has to setText
+        self.latest_progress = (applied, failed, skipped, current_job[:40])
+
+    def _on_form_progress(self, pct):
+        """Session callback per form step; MainWindow polls latest_form_pct."""
+        self.latest_form_pct = pct
+
+    @classmethod
+    def _ensure_modules(cls):
+        """Import the Selenium/automation modules once per process."""
+        with cls._modules_lock:
+            if cls._chrome is not None:
+                return
             import modules.open_chrome as chrome_module
             from modules.automation_manager import LinkedInSession
+            try:
+                from modules import error_recovery
+            except Exception:
+                error_recovery = None
+            cls._LinkedInSession = LinkedInSession
+            cls._error_recovery = error_recovery
+            cls._chrome = chrome_module
+
+    def _run(self):
+        try:
+            self._ensure_modules()
+            chrome_module = self._chrome
+
+            # Stop may arrive while the run is still queued; don't launch Chrome for nothing
+            if self._stop_requested:
+                self.emit_log("Stopped before the browser was opened", "warning")
+                self._finish({})
+                return
 
             self.emit_log("Opening browser...", "info")
             chrome_module.open_browser()
@@ -1074,51 +1723,23 @@ class AutomationWorker(QtCore.QThread):
 
             if not d or not w:
                 self.emit_log("Browser failed to initialize", "error")
-                self.finished_signal.emit({})
+                self._finish({})
                 return
 
-            session = LinkedInSession(d, w, a, log_callback=self.emit_log)
-            
-            # Wire progress callbacks to automation manager (use app_manager attribute)
-            def on_progress(applied, failed, skipped, current_job):
-                try:
-                    self.progress_signal.emit(applied, failed, skipped, current_job)
-                except Exception:
-                    pass
-
-            def on_form_progress(pct: int):
-                try:
-                    self.form_progress_signal.emit(pct)
-                except Exception:
-                    pass
-
-            # app_manager is the JobApplicationManager instance on LinkedInSession
-            try:
-                session.app_manager.progress_callback = on_progress
-                session.app_manager.form_progress_callback = on_form_progress
-            except Exception:
-                # backward compatibility: try older attribute name if present
-                try:
-                    session.job_manager.progress_callback = on_progress
-                    session.job_manager.form_progress_callback = on_form_progress
-                except Exception:
-                    pass
-
-            # If an ErrorRecoveryManager is present, enable blocking captcha wait and
-            # set a callback that will emit a signal to the UI to request user action.
-            try:
-                from modules import error_recovery
-                mgr = getattr(error_recovery, 'current_recovery_manager', None)
-                if mgr:
-                    try:
-                        mgr.config.captcha_blocking_wait = True
-                        mgr.config.captcha_pause_callback = lambda msg: self.captcha_pause_signal.emit(msg or "CAPTCHA detected")
-                        # keep reference for debugging if needed
-                        self.recovery_manager = mgr
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+            session = self._LinkedInSession(
+                d, w, a,
+                log_callback=self.emit_log,
+                progress_callback=self._on_progress,
+                form_progress_callback=self._on_form_progress,
+            )
+            self.session = session
+
+            self._install_captcha_hook(getattr(self._error_recovery, 'current_recovery_manager', None))
+
+            if self._stop_requested:
+                self.emit_log("Stopped before the job search started", "warning")
+                self._finish(session.app_manager.get_statistics())
+                return
 
             # Use defaults for credentials from config if available (login optional)
             stats = session.run_search_and_apply(
@@ -1130,18 +1751,19 @@ class AutomationWorker(QtCore.QThread):
                 prefer_english=self.prefer_english,
             )
 
-            self.finished_signal.emit(stats)
+            self._finish(stats)
 
         except Exception as e:
-            self.emit_log(f"Worker exception: {e}", "error")
-            import traceback
-            traceback.print_exc()
+            self.emit_log(f"Worker exception: {e!r}", "error")
+            # Full tracebacks on stderr only when debugging (AUTOAPPLY_DEBUG=1)
+            if os.environ.get("AUTOAPPLY_DEBUG"):
+                import traceback
+                traceback.print_exc()
             try:
-                from modules.open_chrome import close_browser
-                close_browser()
+                _lazy_module("modules.open_chrome").close_browser()
             except Exception:
                 pass
-            self.finished_signal.emit({"error": str(e)})
+            self._finish({"error": str(e)})
 
 
 if __name__ == '__main__':
@@ -14,30 +14,433 @@ Features:
 import sys
 import os
 import json
+import time
+import functools
+import importlib
+import shutil
 from pathlib import Path
-from datetime import datetime
 
 try:
     from PySide6 import QtCore, QtWidgets, QtGui
-    from PySide6.QtCore import QPropertyAnimation, QEasingCurve, QTimer, Property
+    from PySide6.QtCore import QPropertyAnimation, QEasingCurve, QTimer, Property, Slot
 except Exception as e:
     print("PySide6 is not installed. Install it with: pip install PySide6")
     raise
 
 
+# Activity log colours and icons per level
+_LOG_COLORS = {
+    "info": "#00d4ff",
+    "success": "#00ff88",
+    "warning": "#ffaa00",
+    "error": "#ff4444",
+    "debug": "#888888"
+}
+_LOG_ICONS = {
+    "info": "ℹ️",
+    "success": "✅",
+    "warning": "⚠️",
+    "error": "❌",
+    "debug": "🔧"
+}
+_LOG_MESSAGE_COLOR = "#00ff00"
+
+# Values read from config/<module>.py: section -> {key: (attribute, default)}
+_CONFIG_FIELDS = {
+    "search": {
+        "keywords": ("search_terms", []),
+        "location": ("search_location", ""),
+    },
+    "secrets": {
+        "username": ("username", ""),
+        "password": ("password", ""),
+        "use_ai": ("use_AI", False),
+        "ai_provider": ("ai_provider", "openai"),
+        "api_key": ("llm_api_key", ""),
+        "model": ("llm_model", "gpt-4o"),
+    },
+    "settings": {
+        "headless": ("headless", False),
+        "stealth_mode": ("stealth_mode", True),
+        "safe_mode": ("safe_mode", True),
+    },
+}
+_CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config")
+
+
+def _config_mtimes():
+    """Modification times of the config files, None for missing ones"""
+    mtimes = []
+    for name in _CONFIG_FIELDS:
+        try:
+            mtimes.append(os.stat(os.path.join(_CONFIG_DIR, f"{name}.py")).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_config(mtimes):
+    """Read the config sections; cached until any config file's mtime changes"""
+    # The config package lives next to this file; only needed when actually importing
+    app_dir = os.path.dirname(_CONFIG_DIR)
+    if app_dir not in sys.path:
+        sys.path.insert(0, app_dir)
+    config = {}
+    for name, fields in _CONFIG_FIELDS.items():
+        config[name] = {}
+        module_name = f"config.{name}"
+        try:
+            # Already-imported modules are stale if we got here, so reload them
+            module = sys.modules.get(module_name)
+            module = importlib.reload(module) if module else importlib.import_module(module_name)
+        except ImportError:
+            continue  # file missing: leave the section empty
+        except Exception as e:
+            print(f"Config load error ({name}): {e}")
+            continue
+        values = vars(module)
+        config[name] = {key: values.get(attr, default) for key, (attr, default) in fields.items()}
+    return config
+
+
+@functools.lru_cache(maxsize=1)
+def _find_chrome():
+    """Path of the Chrome executable on PATH, or None; looked up once per process"""
+    for name in ("chrome", "google-chrome", "chromium"):
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _emoji_pixmap(emoji, size):
+    """Emoji rendered once into a transparent pixmap, so painting it is a blit"""
+    ratio = QtGui.QGuiApplication.instance().devicePixelRatio()
+    pixmap = QtGui.QPixmap(round(size * ratio), round(size * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(QtCore.Qt.transparent)
+    font = QtGui.QFont()
+    font.setPixelSize(round(size * 0.8))
+    painter = QtGui.QPainter(pixmap)
+    painter.setFont(font)
+    painter.drawText(QtCore.QRect(0, 0, size, size), QtCore.Qt.AlignCenter, emoji)
+    painter.end()
+    return pixmap
+
+
+@functools.lru_cache(maxsize=1)
+def _dark_palette():
+    """Application palette for the dark theme; built once, on first use"""
+    palette = QtGui.QPalette()
+
+    # Dark colors
+    dark_color = QtGui.QColor(45, 45, 48)
+    darker_color = QtGui.QColor(30, 30, 32)
+    light_color = QtGui.QColor(240, 240, 240)
+
+    palette.setColor(QtGui.QPalette.Window, dark_color)
+    palette.setColor(QtGui.QPalette.WindowText, light_color)
+    palette.setColor(QtGui.QPalette.Base, darker_color)
+    palette.setColor(QtGui.QPalette.AlternateBase, dark_color)
+    palette.setColor(QtGui.QPalette.ToolTipBase, light_color)
+    palette.setColor(QtGui.QPalette.ToolTipText, light_color)
+    palette.setColor(QtGui.QPalette.Text, light_color)
+    palette.setColor(QtGui.QPalette.Button, dark_color)
+    palette.setColor(QtGui.QPalette.ButtonText, light_color)
+    palette.setColor(QtGui.QPalette.BrightText, QtCore.Qt.red)
+    palette.setColor(QtGui.QPalette.Link, QtGui.QColor(42, 130, 218))
+    palette.setColor(QtGui.QPalette.Highlight, QtGui.QColor(42, 130, 218))
+    palette.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
+    return palette
+
+
+# Nav rail entries (page name, icon); the order is the page stack order
+_NAV_ITEMS = (
+    ("Dashboard", "📊"),
+    ("Jobs", "💼"),
+    ("Queue", "📋"),
+    ("History", "📜"),
+    ("AI", "🤖"),
+    ("Settings", "⚙️"),
+)
+
+# Menu bar: (title, items); an item is (icon, text, shortcut, slot name) or None
+# for a separator. Action emoji are drawn as cached icons; menu titles stay text
+# because QMenuBar shows only the icon when a menu has one
+_MENUS = (
+    ("📁 &File", (
+        ("🔄", "&Refresh Settings", "F5", "_refresh_settings"),
+        None,
+        ("🚪", "E&xit", "Ctrl+Q", "close"),
+    )),
+    ("🛠️ &Tools", (
+        ("🔌", "Test Connection", None, "_test_connection"),
+        ("🧹", "Clear Logs", None, "_clear_log"),
+    )),
+    ("❓ &Help", (
+        ("📚", "&Documentation", None, "_show_docs"),
+        ("🐙", "GitHub Repository", None, "_show_github"),
+        None,
+        ("ℹ️", "&About", None, "_show_about"),
+    )),
+)
+
+# Connection status: status bar text and indicator/label colour per status;
+# unknown statuses are shown as "disconnected"
+_STATUS_TEXT = {
+    "disconnected": "🔴 Not Connected",
+    "connecting": "🟡 Connecting...",
+    "connected": "🟢 Connected",
+    "error": "❌ Error",
+}
+_STATUS_COLORS = {
+    "disconnected": "#e74c3c",
+    "connecting": "#f39c12",
+    "connected": "#27ae60",
+    "error": "#c0392b",
+}
+
+# Stat card accent colours; StatCard falls back to the first for others
+_CARD_ACCENTS = ("#3498db", "#27ae60", "#e74c3c")
+
+# Application-wide stylesheet, applied once; widgets opt in via objectName
+APP_QSS = """
+QMenuBar {
+    background-color: #2c3e50;
+    color: #ecf0f1;
+    padding: 5px;
+}
+QMenuBar::item:selected {
+    background-color: #3498db;
+}
+QMenu {
+    background-color: #34495e;
+    color: #ecf0f1;
+}
+QMenu::item:selected {
+    background-color: #3498db;
+}
+QWidget#centralArea {
+    background-color: #2c3e50;
+}
+QFrame#navRail {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #1a1a2e, stop:1 #16213e);
+    border-right: 3px solid #0f3460;
+}
+QFrame#navRail QToolButton {
+    background-color: transparent;
+    color: #e94560;
+    border: none;
+    padding: 10px 4px;
+    text-align: center;
+    font-size: 14px;
+    font-weight: bold;
+    border-radius: 10px;
+    margin: 5px;
+}
+QFrame#navRail QToolButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 rgba(233, 69, 96, 50), stop:1 rgba(15, 52, 96, 100));
+    color: #ffffff;
+}
+QFrame#navRail QToolButton:checked {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #e94560, stop:1 #0f3460);
+    color: #ffffff;
+    font-weight: bold;
+    border-left: 4px solid #00d4ff;
+}
+QLabel#navLogo {
+    font-size: 16px;
+    font-weight: bold;
+    color: #00d4ff;
+    padding: 10px;
+    background: rgba(0, 212, 255, 20);
+    border-radius: 10px;
+    margin-bottom: 10px;
+}
+QFrame#navSeparator {
+    background-color: #0f3460;
+    margin: 10px;
+}
+QWidget#contentArea, QStackedWidget#pages, QWidget#dashboardPage {
+    background-color: #ecf0f1;
+}
+QWidget#logContainer {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #34495e, stop:1 #2c3e50);
+    border-top: 3px solid #3498db;
+}
+QLabel#logTitle {
+    font-size: 16px;
+    font-weight: bold;
+    color: #ecf0f1;
+}
+QPushButton#logClearButton {
+    background-color: #e74c3c;
+    color: white;
+    border: none;
+    border-radius: 5px;
+    padding: 8px 15px;
+    font-weight: bold;
+}
+QPushButton#logClearButton:hover {
+    background-color: #c0392b;
+}
+QTextEdit#activityLog {
+    background-color: #1a1a1a;
+    color: #00ff00;
+    border: 2px solid #0f3460;
+    border-radius: 8px;
+    padding: 10px;
+    font-family: 'Consolas', 'Monaco', monospace;
+    font-size: 12px;
+}
+QFrame#captchaBanner {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #ff6b6b, stop:1 #feca57);
+    border: none;
+    border-bottom: 4px solid #ee5a24;
+    padding: 15px;
+}
+QFrame#captchaBanner QPushButton {
+    background-color: white;
+    color: #2c3e50;
+    border: none;
+    border-radius: 8px;
+    padding: 10px 20px;
+    font-weight: bold;
+    font-size: 14px;
+}
+QFrame#captchaBanner QPushButton:hover {
+    background-color: #ecf0f1;
+}
+QLabel#captchaIcon {
+    font-size: 32px;
+}
+QLabel#captchaText {
+    font-size: 16px;
+    font-weight: bold;
+    color: white;
+}
+QFrame#statCard {
+    border: none;
+    border-radius: 15px;
+    padding: 20px;
+}
+""" + "".join(f"""QFrame#statCard[accent="{accent}"] {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 {accent}, stop:1 #2c3e50);
+}}
+QFrame#statCard[accent="{accent}"]:hover {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 {accent}, stop:1 #34495e);
+}}
+""" for accent in _CARD_ACCENTS) + """QLabel#statIcon {
+    font-size: 48px;
+}
+QLabel#statTitle {
+    font-size: 14px;
+    color: #ecf0f1;
+    font-weight: bold;
+}
+QLabel#statValue {
+    font-size: 42px;
+    font-weight: bold;
+    color: white;
+}
+QLabel#statDescription {
+    font-size: 11px;
+    color: #bdc3c7;
+}
+QWidget#pageHeader {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #667eea, stop:1 #764ba2);
+    border-radius: 15px;
+    padding: 20px;
+}
+QLabel#pageTitle {
+    font-size: 32px;
+    font-weight: bold;
+    color: white;
+}
+QLabel#clockLabel {
+    font-size: 18px;
+    color: white;
+    font-weight: bold;
+}
+QWidget#actionsPanel, QWidget#recentPanel {
+    background-color: white;
+    border-radius: 15px;
+    padding: 20px;
+}
+QLabel#sectionTitle {
+    font-size: 20px;
+    font-weight: bold;
+    color: #2c3e50;
+    margin-bottom: 10px;
+}
+QListWidget#recentList {
+    background-color: #f8f9fa;
+    border: 2px solid #dee2e6;
+    border-radius: 8px;
+    padding: 10px;
+    font-size: 13px;
+}
+QListWidget#recentList::item {
+    padding: 8px;
+    border-bottom: 1px solid #dee2e6;
+}
+QListWidget#recentList::item:hover {
+    background-color: #e9ecef;
+}
+QStatusBar {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #2c3e50, stop:1 #34495e);
+    color: #ecf0f1;
+    border-top: 2px solid #3498db;
+    padding: 5px;
+}
+QLabel#connectionLabel {
+    font-weight: bold;
+    padding: 5px 10px;
+    color: #e74c3c;
+}
+""" + "".join(f"""QLabel#connectionLabel[status="{status}"] {{
+    color: {color};
+}}
+""" for status, color in _STATUS_COLORS.items()) + """QFrame#statusSeparator {
+    background-color: #7f8c8d;
+}
+QLabel#viewLabel {
+    color: #3498db;
+    font-weight: bold;
+}
+"""
+
+
 class ModernButton(QtWidgets.QPushButton):
     """Custom button with modern styling and hover effects"""
-    def __init__(self, text, icon="", parent=None):
+    # Stylesheet per (default_color, hover_color); buttons sharing colours share the string
+    _style_cache = {}
+    
+    def __init__(self, text, icon="", parent=None, default_color="#3498db", hover_color="#2980b9"):
         super().__init__(text, parent)
         self.icon_text = icon
-        self.default_color = "#3498db"
-        self.hover_color = "#2980b9"
+        self.default_color = default_color
+        self.hover_color = hover_color
         self.setMinimumHeight(45)
         self.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
         self._apply_style()
     
     def _apply_style(self):
-        self.setStyleSheet(f"""
+        key = (self.default_color, self.hover_color)
+        style = self._style_cache.get(key)
+        if style is None:
+            style = self._style_cache[key] = f"""
             QPushButton {{
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                     stop:0 {self.default_color}, stop:1 #2c3e50);
@@ -59,7 +462,39 @@ class ModernButton(QtWidgets.QPushButton):
                 background: #95a5a6;
                 color: #ecf0f1;
             }}
-        """)
+        """
+        self.setStyleSheet(style)
+
+
+class StatCard(QtWidgets.QFrame):
+    """Dashboard statistics card; styled by APP_QSS through its accent property"""
+    def __init__(self, title, value, description, icon="📊", color="#3498db", parent=None):
+        super().__init__(parent)
+        self.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.setObjectName("statCard")
+        self.setProperty("accent", color if color in _CARD_ACCENTS else _CARD_ACCENTS[0])
+        self.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        
+        layout = QtWidgets.QVBoxLayout(self)
+        
+        # Icon, title, value and description, top to bottom
+        for text, name in ((icon, "statIcon"), (title, "statTitle"), (value, "statValue")):
+            label = QtWidgets.QLabel(text)
+            label.setObjectName(name)
+            label.setAlignment(QtCore.Qt.AlignCenter)
+            layout.addWidget(label)
+        self.value_label = label
+        
+        desc_label = QtWidgets.QLabel(description)
+        desc_label.setObjectName("statDescription")
+        desc_label.setAlignment(QtCore.Qt.AlignCenter)
+        desc_label.setWordWrap(True)
+        layout.addWidget(desc_label)
+    
+    def set_value(self, text):
+        """Show a new value; a no-op if it is unchanged"""
+        if self.value_label.text() != text:
+            self.value_label.setText(text)
 
 
 class StatusIndicator(QtWidgets.QWidget):
@@ -69,36 +504,44 @@ class StatusIndicator(QtWidgets.QWidget):
         self.status = "disconnected"  # disconnected, connecting, connected, error
         self.setFixedSize(20, 20)
         
-        # Animation timer
+        # Animation timer; only "connecting" pulses, so it runs only in that state
         self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update)
-        self.timer.start(1000)
+        self.timer.setInterval(1000)
+        self.timer.timeout.connect(self._pulse)
         
         self.pulse_value = 0
+        self.alpha = 255
+
+    def _pulse(self):
+        """Advance the pulse and repaint just the circle if its alpha changed"""
+        self.pulse_value = (self.pulse_value + 10) % 255
+        alpha = 128 + self.pulse_value // 2
+        if alpha == self.alpha:
+            return
+        self.alpha = alpha
+        self.update(2, 2, 16, 16)
     
     def set_status(self, status):
         """Set status: disconnected, connecting, connected, error"""
+        if status == self.status:
+            return
         self.status = status
-        self.update()
+        if status == "connecting":
+            self.timer.start()
+        else:
+            self.timer.stop()
+            self.alpha = 255
+        self.update(2, 2, 16, 16)
     
     def paintEvent(self, event):
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
         
         # Color based on status
-        colors = {
-            "disconnected": QtGui.QColor("#e74c3c"),
-            "connecting": QtGui.QColor("#f39c12"),
-            "connected": QtGui.QColor("#27ae60"),
-            "error": QtGui.QColor("#c0392b")
-        }
+        color = QtGui.QColor(_STATUS_COLORS.get(self.status, _STATUS_COLORS["disconnected"]))
         
-        color = colors.get(self.status, colors["disconnected"])
-        
-        # Pulse effect for connecting
-        if self.status == "connecting":
-            self.pulse_value = (self.pulse_value + 10) % 255
-            color.setAlpha(128 + int(self.pulse_value / 2))
+        # Pulse effect for connecting; alpha is advanced by the timer, not by repaints
+        color.setAlpha(self.alpha)
         
         # Draw circle
         painter.setBrush(QtGui.QBrush(color))
@@ -112,6 +555,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setWindowTitle("🚀 Auto Job Applier - Professional Edition")
         self.resize(1400, 900)
         self.setMinimumSize(1200, 800)
+        QtWidgets.QApplication.instance().setStyleSheet(APP_QSS)
         
         # Set dark palette
         self._setup_dark_theme()
@@ -121,6 +565,27 @@ class MainWindow(QtWidgets.QMainWindow):
         self.current_page = "Dashboard"
         self.connection_status = "disconnected"
         
+        # Log lines are buffered and flushed to the widget at most every 50 ms
+        self._log_buf = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+        
+        # Log lines are inserted as plain text: a bold "[ts] icon [LEVEL]" prefix in the
+        # level's colour, then the message; unknown levels get a white prefix
+        self._fmt_by_level = {}
+        for level, color in _LOG_COLORS.items():
+            fmt = QtGui.QTextCharFormat()
+            fmt.setForeground(QtGui.QColor(color))
+            fmt.setFontWeight(QtGui.QFont.Bold)
+            self._fmt_by_level[level] = fmt
+        self._fmt_default = QtGui.QTextCharFormat()
+        self._fmt_default.setForeground(QtGui.QColor("#ffffff"))
+        self._fmt_default.setFontWeight(QtGui.QFont.Bold)
+        self._fmt_message = QtGui.QTextCharFormat()
+        self._fmt_message.setForeground(QtGui.QColor(_LOG_MESSAGE_COLOR))
+        
         # Load configurations
         self._load_config()
         
@@ -136,75 +601,12 @@ class MainWindow(QtWidgets.QMainWindow):
     
     def _setup_dark_theme(self):
         """Setup modern dark theme"""
-        palette = QtGui.QPalette()
-        
-        # Dark colors
-        dark_color = QtGui.QColor(45, 45, 48)
-        darker_color = QtGui.QColor(30, 30, 32)
-        light_color = QtGui.QColor(240, 240, 240)
-        
-        palette.setColor(QtGui.QPalette.Window, dark_color)
-        palette.setColor(QtGui.QPalette.WindowText, light_color)
-        palette.setColor(QtGui.QPalette.Base, darker_color)
-        palette.setColor(QtGui.QPalette.AlternateBase, dark_color)
-        palette.setColor(QtGui.QPalette.ToolTipBase, light_color)
-        palette.setColor(QtGui.QPalette.ToolTipText, light_color)
-        palette.setColor(QtGui.QPalette.Text, light_color)
-        palette.setColor(QtGui.QPalette.Button, dark_color)
-        palette.setColor(QtGui.QPalette.ButtonText, light_color)
-        palette.setColor(QtGui.QPalette.BrightText, QtCore.Qt.red)
-        palette.setColor(QtGui.QPalette.Link, QtGui.QColor(42, 130, 218))
-        palette.setColor(QtGui.QPalette.Highlight, QtGui.QColor(42, 130, 218))
-        palette.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
-        
-        QtWidgets.QApplication.instance().setPalette(palette)
+        QtWidgets.QApplication.instance().setPalette(_dark_palette())
 
     def _load_config(self):
         """Load configuration from files"""
-        self.config = {
-            "search": {},
-            "secrets": {},
-            "settings": {}
-        }
-        
-        try:
-            # Try to load from config files
-            sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-            
-            try:
-                from config import search
-                self.config["search"] = {
-                    "keywords": getattr(search, "search_terms", []),
-                    "location": getattr(search, "search_location", ""),
-                }
-            except:
-                pass
-            
-            try:
-                from config import secrets
-                self.config["secrets"] = {
-                    "username": getattr(secrets, "username", ""),
-                    "password": getattr(secrets, "password", ""),
-                    "use_ai": getattr(secrets, "use_AI", False),
-                    "ai_provider": getattr(secrets, "ai_provider", "openai"),
-                    "api_key": getattr(secrets, "llm_api_key", ""),
-                    "model": getattr(secrets, "llm_model", "gpt-4o"),
-                }
-            except:
-                pass
-                
-            try:
-                from config import settings
-                self.config["settings"] = {
-                    "headless": getattr(settings, "headless", False),
-                    "stealth_mode": getattr(settings, "stealth_mode", True),
-                    "safe_mode": getattr(settings, "safe_mode", True),
-                }
-            except:
-                pass
-                
-        except Exception as e:
-            print(f"Config load error: {e}")
+        # Copy the sections so edits to self.config never leak into the cache
+        self.config = {name: dict(section) for name, section in _read_config(_config_mtimes()).items()}
 
     def _save_config(self):
         """Save configuration to files"""
@@ -220,73 +622,40 @@ class MainWindow(QtWidgets.QMainWindow):
         return False
 
     def _setup_menubar(self):
-        """Create modern menu bar"""
+        """Create modern menu bar from _MENUS"""
         menubar = self.menuBar()
-        menubar.setStyleSheet("""
-            QMenuBar {
-                background-color: #2c3e50;
-                color: #ecf0f1;
-                padding: 5px;
-            }
-            QMenuBar::item:selected {
-                background-color: #3498db;
-            }
-            QMenu {
-                background-color: #34495e;
-                color: #ecf0f1;
-            }
-            QMenu::item:selected {
-                background-color: #3498db;
-            }
-        """)
-        
-        # File menu
-        file_menu = menubar.addMenu("📁 &File")
-        
-        refresh_action = QtGui.QAction("🔄 &Refresh Settings", self)
-        refresh_action.setShortcut("F5")
-        refresh_action.triggered.connect(self._refresh_settings)
-        file_menu.addAction(refresh_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QtGui.QAction("🚪 E&xit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Tools menu
-        tools_menu = menubar.addMenu("🛠️ &Tools")
-        
-        test_conn = QtGui.QAction("🔌 Test Connection", self)
-        test_conn.triggered.connect(self._test_connection)
-        tools_menu.addAction(test_conn)
-        
-        clear_logs = QtGui.QAction("🧹 Clear Logs", self)
-        clear_logs.triggered.connect(lambda: self.log_text.clear())
-        tools_menu.addAction(clear_logs)
-        
-        # Help menu
-        help_menu = menubar.addMenu("❓ &Help")
-        
-        docs_action = QtGui.QAction("📚 &Documentation", self)
-        docs_action.triggered.connect(lambda: self._log("info", "📖 See docs/ folder for documentation"))
-        help_menu.addAction(docs_action)
-        
-        github_action = QtGui.QAction("🐙 GitHub Repository", self)
-        github_action.triggered.connect(lambda: self._log("info", "🔗 https://github.com/Solaceking/Job-Autoapply-"))
-        help_menu.addAction(github_action)
-        
-        help_menu.addSeparator()
-        
-        about_action = QtGui.QAction("ℹ️ &About", self)
-        about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
+        for title, items in _MENUS:
+            menu = menubar.addMenu(title)
+            for item in items:
+                if item is None:
+                    menu.addSeparator()
+                    continue
+                icon, text, shortcut, slot = item
+                action = QtGui.QAction(QtGui.QIcon(_emoji_pixmap(icon, 16)), text, self)
+                if shortcut:
+                    action.setShortcut(shortcut)
+                action.triggered.connect(getattr(self, slot))
+                menu.addAction(action)
+
+    @Slot()
+    def _clear_log(self):
+        """Clear the activity log"""
+        self.log_text.clear()
+
+    @Slot()
+    def _show_docs(self):
+        """Point the user at the bundled documentation"""
+        self._log("info", "📖 See docs/ folder for documentation")
+
+    @Slot()
+    def _show_github(self):
+        """Log the project's GitHub URL"""
+        self._log("info", "🔗 https://github.com/Solaceking/Job-Autoapply-")
 
     def _setup_ui(self):
         """Create the main UI layout"""
         central = QtWidgets.QWidget()
-        central.setStyleSheet("background-color: #2c3e50;")
+        central.setObjectName("centralArea")
         main_layout = QtWidgets.QHBoxLayout(central)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
@@ -305,36 +674,7 @@ class MainWindow(QtWidgets.QMainWindow):
         """Create modern left navigation rail with large icons"""
         nav = QtWidgets.QFrame()
         nav.setFixedWidth(120)
-        nav.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1a1a2e, stop:1 #16213e);
-                border-right: 3px solid #0f3460;
-            }
-            QPushButton {
-                background-color: transparent;
-                color: #e94560;
-                border: none;
-                padding: 15px 10px;
-                text-align: center;
-                font-size: 24px;
-                font-weight: bold;
-                border-radius: 10px;
-                margin: 5px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(233, 69, 96, 50), stop:1 rgba(15, 52, 96, 100));
-                color: #ffffff;
-            }
-            QPushButton:checked {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #e94560, stop:1 #0f3460);
-                color: #ffffff;
-                font-weight: bold;
-                border-left: 4px solid #00d4ff;
-            }
-        """)
+        nav.setObjectName("navRail")
         
         nav_layout = QtWidgets.QVBoxLayout(nav)
         nav_layout.setContentsMargins(5, 20, 5, 20)
@@ -344,40 +684,33 @@ class MainWindow(QtWidgets.QMainWindow):
         # Logo/Title
         logo_label = QtWidgets.QLabel("🚀\nAuto\nJobs")
         logo_label.setAlignment(QtCore.Qt.AlignCenter)
-        logo_label.setStyleSheet("""
-            font-size: 16px;
-            font-weight: bold;
-            color: #00d4ff;
-            padding: 10px;
-            background: rgba(0, 212, 255, 20);
-            border-radius: 10px;
-            margin-bottom: 10px;
-        """)
+        logo_label.setObjectName("navLogo")
         nav_layout.addWidget(logo_label)
         
         # Separator
         separator = QtWidgets.QFrame()
         separator.setFrameShape(QtWidgets.QFrame.HLine)
-        separator.setStyleSheet("background-color: #0f3460; margin: 10px;")
+        separator.setObjectName("navSeparator")
         nav_layout.addWidget(separator)
 
-        # Navigation buttons with LARGE icons
+        # Navigation buttons with LARGE icons; the exclusive group keeps exactly one checked
         self.nav_buttons = {}
-        nav_items = [
-            ("Dashboard", "📊"),
-            ("Jobs", "💼"),
-            ("Queue", "📋"),
-            ("History", "📜"),
-            ("AI", "🤖"),
-            ("Settings", "⚙️"),
-        ]
-
-        for name, icon in nav_items:
-            btn = QtWidgets.QPushButton(f"{icon}\n{name}")
+        self.nav_group = QtWidgets.QButtonGroup(self)
+        self.nav_group.setExclusive(True)
+        self.nav_group.idClicked.connect(self._nav_id_clicked)
+        hand = QtGui.QCursor(QtCore.Qt.PointingHandCursor)
+        for nav_id, (name, icon) in enumerate(_NAV_ITEMS):
+            # Icon is a cached pixmap rather than emoji text, which Qt re-shapes on every paint
+            btn = QtWidgets.QToolButton()
+            btn.setText(name)
+            btn.setIcon(QtGui.QIcon(_emoji_pixmap(icon, 32)))
+            btn.setIconSize(QtCore.QSize(32, 32))
+            btn.setToolButtonStyle(QtCore.Qt.ToolButtonTextUnderIcon)
+            btn.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
             btn.setFixedHeight(90)
             btn.setCheckable(True)
-            btn.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
-            btn.clicked.connect(lambda checked, n=name: self._switch_page_animated(n))
+            btn.setCursor(hand)
+            self.nav_group.addButton(btn, nav_id)
             nav_layout.addWidget(btn)
             self.nav_buttons[name] = btn
 
@@ -388,7 +721,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def _create_content_area(self):
         """Create main content area with modern styling"""
         content = QtWidgets.QWidget()
-        content.setStyleSheet("background-color: #ecf0f1;")
+        content.setObjectName("contentArea")
         content_layout = QtWidgets.QVBoxLayout(content)
         content_layout.setContentsMargins(0, 0, 0, 0)
         content_layout.setSpacing(0)
@@ -399,72 +732,51 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Stacked widget for pages
         self.pages = QtWidgets.QStackedWidget()
-        self.pages.setStyleSheet("""
-            QStackedWidget {
-                background-color: #ecf0f1;
-            }
-        """)
+        self.pages.setObjectName("pages")
         content_layout.addWidget(self.pages, 1)
 
-        # Create all pages
-        self.pages.addWidget(self._create_dashboard_page())
-        self.pages.addWidget(self._create_jobs_page())
-        self.pages.addWidget(self._create_queue_page())
-        self.pages.addWidget(self._create_history_page())
-        self.pages.addWidget(self._create_ai_page())
-        self.pages.addWidget(self._create_settings_page())
+        # Pages other than the Dashboard are built on first visit (see _ensure_page);
+        # empty placeholders keep the stack indices stable until then
+        self._page_factories = {
+            "Dashboard": "_create_dashboard_page",
+            "Jobs": "_create_jobs_page",
+            "Queue": "_create_queue_page",
+            "History": "_create_history_page",
+            "AI": "_create_ai_page",
+            "Settings": "_create_settings_page",
+        }
+        self._page_index = {name: i for i, name in enumerate(self._page_factories)}
+        self._page_built = set()
+        for _ in self._page_factories:
+            self.pages.addWidget(QtWidgets.QWidget())
+        self._ensure_page("Dashboard")
 
         # Shared log area at bottom with modern styling
         log_container = QtWidgets.QWidget()
-        log_container.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #34495e, stop:1 #2c3e50);
-                border-top: 3px solid #3498db;
-            }
-        """)
+        log_container.setObjectName("logContainer")
         log_container_layout = QtWidgets.QVBoxLayout(log_container)
         log_container_layout.setContentsMargins(15, 10, 15, 10)
         
         log_header = QtWidgets.QHBoxLayout()
         log_title = QtWidgets.QLabel("📋 Activity Log")
-        log_title.setStyleSheet("font-size: 16px; font-weight: bold; color: #ecf0f1;")
+        log_title.setObjectName("logTitle")
         log_header.addWidget(log_title)
         log_header.addStretch()
         
         clear_btn = QtWidgets.QPushButton("🧹 Clear")
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 15px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-        """)
-        clear_btn.clicked.connect(lambda: self.log_text.clear())
+        clear_btn.setObjectName("logClearButton")
+        clear_btn.clicked.connect(self._clear_log)
         log_header.addWidget(clear_btn)
         
         log_container_layout.addLayout(log_header)
         
         self.log_text = QtWidgets.QTextEdit()
+        self.log_text.setObjectName("activityLog")
         self.log_text.setReadOnly(True)
+        self.log_text.setUndoRedoEnabled(False)
+        self.log_text.setAcceptRichText(False)
+        self.log_text.document().setMaximumBlockCount(2000)
         self.log_text.setMaximumHeight(180)
-        self.log_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #1a1a1a;
-                color: #00ff00;
-                border: 2px solid #0f3460;
-                border-radius: 8px;
-                padding: 10px;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 12px;
-            }
-        """)
         log_container_layout.addWidget(self.log_text)
         
         content_layout.addWidget(log_container)
@@ -474,37 +786,17 @@ class MainWindow(QtWidgets.QMainWindow):
     def _create_captcha_banner(self):
         """Create modern CAPTCHA notification banner"""
         banner = QtWidgets.QFrame()
-        banner.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #ff6b6b, stop:1 #feca57);
-                border: none;
-                border-bottom: 4px solid #ee5a24;
-                padding: 15px;
-            }
-            QPushButton {
-                background-color: white;
-                color: #2c3e50;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #ecf0f1;
-            }
-        """)
+        banner.setObjectName("captchaBanner")
         banner.setVisible(False)
         
         banner_layout = QtWidgets.QHBoxLayout(banner)
         
         icon_label = QtWidgets.QLabel("⚠️")
-        icon_label.setStyleSheet("font-size: 32px;")
+        icon_label.setObjectName("captchaIcon")
         banner_layout.addWidget(icon_label)
         
         self.captcha_label = QtWidgets.QLabel("CAPTCHA detected! Please solve it in the browser window.")
-        self.captcha_label.setStyleSheet("font-size: 16px; font-weight: bold; color: white;")
+        self.captcha_label.setObjectName("captchaText")
         self.captcha_label.setWordWrap(True)
         banner_layout.addWidget(self.captcha_label, 1)
         
@@ -518,87 +810,35 @@ class MainWindow(QtWidgets.QMainWindow):
         
         return banner
 
-    def _create_stat_card(self, title, value, description, icon="📊", color="#3498db"):
-        """Create an enhanced statistics card widget"""
-        card = QtWidgets.QFrame()
-        card.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        card.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {color}, stop:1 #2c3e50);
-                border: none;
-                border-radius: 15px;
-                padding: 20px;
-            }}
-            QFrame:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {color}, stop:1 #34495e);
-            }}
-        """)
-        card.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
-        
-        card_layout = QtWidgets.QVBoxLayout(card)
-        
-        # Icon
-        icon_label = QtWidgets.QLabel(icon)
-        icon_label.setStyleSheet("font-size: 48px;")
-        icon_label.setAlignment(QtCore.Qt.AlignCenter)
-        card_layout.addWidget(icon_label)
-        
-        # Title
-        title_label = QtWidgets.QLabel(title)
-        title_label.setStyleSheet("font-size: 14px; color: #ecf0f1; font-weight: bold;")
-        title_label.setAlignment(QtCore.Qt.AlignCenter)
-        card_layout.addWidget(title_label)
-        
-        # Value
-        value_label = QtWidgets.QLabel(value)
-        value_label.setStyleSheet("font-size: 42px; font-weight: bold; color: white;")
-        value_label.setAlignment(QtCore.Qt.AlignCenter)
-        card_layout.addWidget(value_label)
-        
-        # Description
-        desc_label = QtWidgets.QLabel(description)
-        desc_label.setStyleSheet("font-size: 11px; color: #bdc3c7;")
-        desc_label.setAlignment(QtCore.Qt.AlignCenter)
-        desc_label.setWordWrap(True)
-        card_layout.addWidget(desc_label)
-        
-        return card
-
     def _create_dashboard_page(self):
         """Dashboard page with modern design"""
         page = QtWidgets.QWidget()
-        page.setStyleSheet("background-color: #ecf0f1;")
+        page.setObjectName("dashboardPage")
         layout = QtWidgets.QVBoxLayout(page)
         layout.setContentsMargins(30, 30, 30, 30)
         layout.setSpacing(20)
         
         # Page title with gradient
         title_container = QtWidgets.QWidget()
-        title_container.setStyleSheet("""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                stop:0 #667eea, stop:1 #764ba2);
-            border-radius: 15px;
-            padding: 20px;
-        """)
+        title_container.setObjectName("pageHeader")
         title_layout = QtWidgets.QHBoxLayout(title_container)
         
         title = QtWidgets.QLabel("📊 Dashboard Overview")
-        title.setStyleSheet("font-size: 32px; font-weight: bold; color: white;")
+        title.setObjectName("pageTitle")
         title_layout.addWidget(title)
         title_layout.addStretch()
         
         # Add real-time clock
         self.clock_label = QtWidgets.QLabel()
-        self.clock_label.setStyleSheet("font-size: 18px; color: white; font-weight: bold;")
-        self._update_clock()
+        self.clock_label.setObjectName("clockLabel")
         title_layout.addWidget(self.clock_label)
         
-        # Timer for clock
-        clock_timer = QTimer(self)
-        clock_timer.timeout.connect(self._update_clock)
-        clock_timer.start(1000)
+        # Single-shot timer re-armed by _update_clock for each wall-clock second
+        self._clock_text = None
+        self._clock_timer = QTimer(self)
+        self._clock_timer.setSingleShot(True)
+        self._clock_timer.timeout.connect(self._update_clock)
+        self._update_clock()
         
         layout.addWidget(title_container)
         
@@ -606,52 +846,42 @@ class MainWindow(QtWidgets.QMainWindow):
         stats_layout = QtWidgets.QHBoxLayout()
         stats_layout.setSpacing(20)
         
-        self.apps_card = self._create_stat_card("Applications", "0", "Total submitted", "✅", "#27ae60")
+        self.apps_card = StatCard("Applications", "0", "Total submitted", "✅", "#27ae60")
         stats_layout.addWidget(self.apps_card)
         
-        self.success_card = self._create_stat_card("Success Rate", "0%", "Applications vs attempts", "📈", "#3498db")
+        self.success_card = StatCard("Success Rate", "0%", "Applications vs attempts", "📈", "#3498db")
         stats_layout.addWidget(self.success_card)
         
-        self.today_card = self._create_stat_card("Today", "0", "Applications today", "🔥", "#e74c3c")
+        self.today_card = StatCard("Today", "0", "Applications today", "🔥", "#e74c3c")
         stats_layout.addWidget(self.today_card)
         
         layout.addLayout(stats_layout)
         
         # Quick actions with modern cards
         actions_container = QtWidgets.QWidget()
-        actions_container.setStyleSheet("""
-            background-color: white;
-            border-radius: 15px;
-            padding: 20px;
-        """)
+        actions_container.setObjectName("actionsPanel")
         actions_layout = QtWidgets.QVBoxLayout(actions_container)
         
         actions_title = QtWidgets.QLabel("⚡ Quick Actions")
-        actions_title.setStyleSheet("font-size: 20px; font-weight: bold; color: #2c3e50; margin-bottom: 10px;")
+        actions_title.setObjectName("sectionTitle")
         actions_layout.addWidget(actions_title)
         
         # Action buttons
         actions_btn_layout = QtWidgets.QHBoxLayout()
         
-        start_btn = ModernButton("▶️ Start Job Search", "▶️")
-        start_btn.default_color = "#27ae60"
-        start_btn.hover_color = "#229954"
-        start_btn._apply_style()
-        start_btn.clicked.connect(lambda: self._switch_page_animated("Jobs"))
+        start_btn = ModernButton("▶️ Start Job Search", "▶️", default_color="#27ae60", hover_color="#229954")
+        start_btn.setProperty("page", "Jobs")
+        start_btn.clicked.connect(self._nav_clicked)
         actions_btn_layout.addWidget(start_btn)
         
         config_btn = ModernButton("⚙️ Configure", "⚙️")
-        config_btn.default_color = "#3498db"
-        config_btn.hover_color = "#2980b9"
-        config_btn._apply_style()
-        config_btn.clicked.connect(lambda: self._switch_page_animated("Settings"))
+        config_btn.setProperty("page", "Settings")
+        config_btn.clicked.connect(self._nav_clicked)
         actions_btn_layout.addWidget(config_btn)
         
-        history_btn = ModernButton("📜 View History", "📜")
-        history_btn.default_color = "#9b59b6"
-        history_btn.hover_color = "#8e44ad"
-        history_btn._apply_style()
-        history_btn.clicked.connect(lambda: self._switch_page_animated("History"))
+        history_btn = ModernButton("📜 View History", "📜", default_color="#9b59b6", hover_color="#8e44ad")
+        history_btn.setProperty("page", "History")
+        history_btn.clicked.connect(self._nav_clicked)
         actions_btn_layout.addWidget(history_btn)
         
         actions_layout.addLayout(actions_btn_layout)
@@ -659,34 +889,15 @@ class MainWindow(QtWidgets.QMainWindow):
         
         # Recent activity
         recent_container = QtWidgets.QWidget()
-        recent_container.setStyleSheet("""
-            background-color: white;
-            border-radius: 15px;
-            padding: 20px;
-        """)
+        recent_container.setObjectName("recentPanel")
         recent_layout = QtWidgets.QVBoxLayout(recent_container)
         
         recent_title = QtWidgets.QLabel("📰 Recent Activity")
-        recent_title.setStyleSheet("font-size: 20px; font-weight: bold; color: #2c3e50; margin-bottom: 10px;")
+        recent_title.setObjectName("sectionTitle")
         recent_layout.addWidget(recent_title)
         
         self.recent_list = QtWidgets.QListWidget()
-        self.recent_list.setStyleSheet("""
-            QListWidget {
-                background-color: #f8f9fa;
-                border: 2px solid #dee2e6;
-                border-radius: 8px;
-                padding: 10px;
-                font-size: 13px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #dee2e6;
-            }
-            QListWidget::item:hover {
-                background-color: #e9ecef;
-            }
-        """)
+        self.recent_list.setObjectName("recentList")
         self.recent_list.addItem("🎉 Welcome to Auto Job Applier!")
         self.recent_list.addItem("ℹ️ Configure your settings to get started")
         self.recent_list.addItem("💡 Tip: Start with 3-5 applications to test")
@@ -697,49 +908,64 @@ class MainWindow(QtWidgets.QMainWindow):
         return page
 
     def _update_clock(self):
-        """Update real-time clock"""
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        self.clock_label.setText(f"🕐 {current_time}")
+        """Update real-time clock, then wait for the next whole second"""
+        now = time.time()
+        text = f"🕐 {time.strftime('%I:%M:%S %p', time.localtime(now))}"
+        # An early timeout lands in the same second; skip the relayout
+        if text != self._clock_text:
+            self._clock_text = text
+            self.clock_label.setText(text)
+        self._clock_timer.start(1000 - int(now * 1000) % 1000)
 
     def _create_jobs_page(self):
         """Jobs page with enhanced styling - TO BE CONTINUED..."""
         # This file is getting large, I'll continue in the next section
         pass
 
+    def _ensure_page(self, page_name):
+        """Build a page the first time it is needed, replacing its placeholder"""
+        if page_name in self._page_built:
+            return
+        self._page_built.add(page_name)
+        # Factories are looked up by name; pages not written yet keep the blank placeholder
+        factory = getattr(self, self._page_factories[page_name], None)
+        page = factory() if factory else None
+        if page is None:
+            return
+        index = self._page_index[page_name]
+        placeholder = self.pages.widget(index)
+        self.pages.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.pages.insertWidget(index, page)
+
+    def _nav_id_clicked(self, nav_id):
+        """Switch to the page behind the clicked nav rail button"""
+        self._switch_page_animated(_NAV_ITEMS[nav_id][0])
+
+    def _nav_clicked(self):
+        """Switch to the page named by the clicked button's "page" property"""
+        self._switch_page_animated(self.sender().property("page"))
+
     def _switch_page_animated(self, page_name):
         """Switch pages with fade animation"""
-        page_index = {
-            "Dashboard": 0,
-            "Jobs": 1,
-            "Queue": 2,
-            "History": 3,
-            "AI": 4,
-            "Settings": 5
-        }.get(page_name, 0)
+        if page_name not in self._page_index:
+            page_name = "Dashboard"
+        self._ensure_page(page_name)
+        page_index = self._page_index[page_name]
         
         # Fade animation
         self.pages.setCurrentIndex(page_index)
         self.current_page = page_name
         self.statusbar_label.setText(f"📍 View: {page_name}")
         
-        # Update navigation buttons
-        for name, btn in self.nav_buttons.items():
-            btn.setChecked(name == page_name)
+        # Update navigation buttons; nav ids follow the page order
+        self.nav_group.button(page_index).setChecked(True)
         
         self._log("info", f"🔄 Navigated to {page_name}")
 
     def _setup_statusbar(self):
         """Setup modern status bar"""
         status_bar = self.statusBar()
-        status_bar.setStyleSheet("""
-            QStatusBar {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #2c3e50, stop:1 #34495e);
-                color: #ecf0f1;
-                border-top: 2px solid #3498db;
-                padding: 5px;
-            }
-        """)
         
         # Status indicator
         self.status_indicator = StatusIndicator()
@@ -747,62 +973,57 @@ class MainWindow(QtWidgets.QMainWindow):
         
         # Connection label
         self.connection_label = QtWidgets.QLabel("🔴 Not Connected")
-        self.connection_label.setStyleSheet("""
-            font-weight: bold;
-            padding: 5px 10px;
-            color: #e74c3c;
-        """)
+        self.connection_label.setObjectName("connectionLabel")
         status_bar.addPermanentWidget(self.connection_label)
         
         # Separator
         separator = QtWidgets.QFrame()
         separator.setFrameShape(QtWidgets.QFrame.VLine)
-        separator.setStyleSheet("background-color: #7f8c8d;")
+        separator.setObjectName("statusSeparator")
         status_bar.addPermanentWidget(separator)
         
         # Current view
         self.statusbar_label = QtWidgets.QLabel("📍 View: Dashboard")
-        self.statusbar_label.setStyleSheet("color: #3498db; font-weight: bold;")
+        self.statusbar_label.setObjectName("viewLabel")
         status_bar.addWidget(self.statusbar_label)
 
     def _log(self, level, message):
         """Enhanced logging with colors and timestamps"""
-        timestamp = QtCore.QTime.currentTime().toString("HH:mm:ss")
-        
-        # HTML colored output
-        color_map = {
-            "info": "#00d4ff",
-            "success": "#00ff88",
-            "warning": "#ffaa00",
-            "error": "#ff4444",
-            "debug": "#888888"
-        }
-        
-        icon_map = {
-            "info": "ℹ️",
-            "success": "✅",
-            "warning": "⚠️",
-            "error": "❌",
-            "debug": "🔧"
-        }
-        
-        color = color_map.get(level, "#ffffff")
-        icon = icon_map.get(level, "•")
-        
-        formatted_msg = f'<span style="color: {color}; font-weight: bold;">[{timestamp}] {icon} [{level.upper()}]</span> <span style="color: #00ff00;">{message}</span>'
-        self.log_text.append(formatted_msg)
-        
-        # Auto-scroll to bottom
+        prefix = f"[{time.strftime('%H:%M:%S')}] {_LOG_ICONS.get(level, '•')} [{level.upper()}]"
+        # Written to the widget in batches by _flush_log
+        self._log_buf.append((level, prefix, message))
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Insert all buffered log lines in one edit block and scroll once"""
+        if not self._log_buf:
+            return
         scrollbar = self.log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        
+        cursor = QtGui.QTextCursor(self.log_text.document())
+        cursor.movePosition(QtGui.QTextCursor.End)
+        cursor.beginEditBlock()
+        fmt_message = self._fmt_message
+        for level, prefix, message in self._log_buf:
+            # One block per line so the block limit trims whole lines
+            if not cursor.atStart():
+                cursor.insertBlock()
+            cursor.insertText(prefix, self._fmt_by_level.get(level, self._fmt_default))
+            cursor.insertText(" " + message, fmt_message)
+        cursor.endEditBlock()
+        self._log_buf.clear()
+        
+        # Follow new lines unless the user has scrolled up to read older ones
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
 
     def _check_initial_connection(self):
         """Check initial connection status"""
         try:
-            # Check if Chrome is available
-            import subprocess
-            result = subprocess.run(['where', 'chrome'], capture_output=True, text=True)
-            if result.returncode == 0:
+            # Check if Chrome is available (a PATH scan, no child process)
+            if _find_chrome():
                 self._update_connection_status("disconnected")
                 self._log("info", "🌐 Chrome browser detected")
             else:
@@ -811,45 +1032,42 @@ class MainWindow(QtWidgets.QMainWindow):
         except:
             self._update_connection_status("disconnected")
 
+    @Slot(str)
     def _update_connection_status(self, status):
         """Update connection status indicator"""
+        if status == self.connection_status:
+            return
         self.connection_status = status
         self.status_indicator.set_status(status)
         
-        status_text = {
-            "disconnected": "🔴 Not Connected",
-            "connecting": "🟡 Connecting...",
-            "connected": "🟢 Connected",
-            "error": "❌ Error"
-        }
-        
-        status_color = {
-            "disconnected": "#e74c3c",
-            "connecting": "#f39c12",
-            "connected": "#27ae60",
-            "error": "#c0392b"
-        }
-        
-        text = status_text.get(status, "🔴 Not Connected")
-        color = status_color.get(status, "#e74c3c")
-        
-        self.connection_label.setText(text)
-        self.connection_label.setStyleSheet(f"font-weight: bold; padding: 5px 10px; color: {color};")
+        label = self.connection_label
+        label.setText(_STATUS_TEXT.get(status, _STATUS_TEXT["disconnected"]))
+        # Colour comes from APP_QSS through the status property; re-polish to apply it
+        label.setProperty("status", status)
+        label.style().unpolish(label)
+        label.style().polish(label)
 
+    @Slot()
     def _test_connection(self):
         """Test connection to LinkedIn"""
         self._log("info", "🔌 Testing connection...")
         self._update_connection_status("connecting")
         
         # Simulate connection test
-        QTimer.singleShot(2000, lambda: self._update_connection_status("connected"))
-        QTimer.singleShot(2000, lambda: self._log("success", "✅ Connection test successful!"))
+        QTimer.singleShot(2000, self._connection_test_done)
+
+    def _connection_test_done(self):
+        """Finish the simulated connection test"""
+        self._update_connection_status("connected")
+        self._log("success", "✅ Connection test successful!")
 
+    @Slot()
     def _refresh_settings(self):
         """Refresh settings from config files"""
         self._load_config()
         self._log("success", "🔄 Settings refreshed from config files")
 
+    @Slot()
     def _show_about(self):
         """Show enhanced about dialog"""
         about_text = """
@@ -879,11 +1097,13 @@ class MainWindow(QtWidgets.QMainWindow):
         msg_box.setStandardButtons(QtWidgets.QMessageBox.Ok)
         msg_box.exec()
 
+    @Slot()
     def _on_captcha_resume(self):
         """Resume after CAPTCHA"""
         self.captcha_banner.setVisible(False)
         self._log("info", "▶️ Resuming after CAPTCHA")
 
+    @Slot()
     def _on_captcha_cancel(self):
         """Cancel after CAPTCHA"""
         self.captcha_banner.setVisible(False)
@@ -9,9 +9,6 @@ Qt-based GUI for modern, cross-platform experience.
 import sys
 import os
 
-# Add current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 def main():
     """Launch the Qt GUI application"""
     try:
@@ -65,4 +62,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Make gui/modules/config importable however the script is launched;
+    # importers of this module already have their own path set up
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
     main()
@@ -569,13 +569,22 @@ class LinkedInSession:
     Handles login, job search, and bulk applications.
     """
     
-    def __init__(self, driver: WebDriver, wait: WebDriverWait, actions: ActionChains, log_callback: Callable = None):
-        """Initialize LinkedIn session."""
+    def __init__(self, driver: WebDriver, wait: WebDriverWait, actions: ActionChains, log_callback: Callable = None,
+                 progress_callback: Callable = None, form_progress_callback: Callable = None):
+        """
+        Initialize LinkedIn session.
+        
+        progress_callback and form_progress_callback are handed to the
+        JobApplicationManager and called from the automation thread after
+        each job and each form step respectively.
+        """
         self.driver = driver
         self.wait = wait
         self.actions = actions
         self.log_callback = log_callback or print_lg
         self.app_manager = JobApplicationManager(driver, wait, actions, log_callback)
+        self.app_manager.progress_callback = progress_callback
+        self.app_manager.form_progress_callback = form_progress_callback
     
     def log(self, message: str, level: str = "info"):
         """Log a message."""
@@ -20,9 +20,6 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 
-if stealth_mode:
-    import undetected_chromedriver as uc
-
 # Global variables
 driver = None
 wait = None
@@ -34,6 +31,10 @@ def open_browser():
     global driver, wait, actions
     
     try:
+        # Imported here so close_browser() and the GUI don't pay for (or need) it
+        if stealth_mode:
+            import undetected_chromedriver as uc
+
         make_directories([
             file_name,
             failed_file_name,
@@ -6,9 +6,16 @@ This module provides a thin API to read search-related settings from
 
 It is intentionally conservative and only writes simple top-level
 variables (str, bool, int, list).
+
+Personal settings are read through a pickle cache (`config/personals.bin`)
+that is rebuilt whenever `config/personals.py` changes, so the `.py` file
+stays the human-editable source of truth.
 """
+import os
 import re
 import ast
+import pickle
+import tempfile
 from typing import Any, Dict
 
 SEARCH_CONFIG_PATH = "config/search.py"
@@ -52,16 +59,20 @@ def load_search_settings() -> Dict[str, Any]:
     return settings
 
 
-def save_search_settings(updates: Dict[str, Any]) -> None:
+def save_search_settings(updates: Dict[str, Any]) -> bool:
     """Apply updates to `config/search.py` by replacing top-level assignments.
 
     Only updates keys that already exist in the file. Other keys are appended
-    at the end of the file.
+    at the end of the file. The file is replaced atomically, and left
+    untouched when the updates would not change its contents.
+
+    Returns True if the file was written, False if nothing changed.
     """
     try:
         with open(SEARCH_CONFIG_PATH, "r", encoding="utf-8") as f:
-            src = f.read()
+            original = f.read()
 
+        src = original
         appended = []
         for key, val in updates.items():
             # Prepare python literal string for value
@@ -76,21 +87,43 @@ def save_search_settings(updates: Dict[str, Any]) -> None:
             # append at end before trailing comments if present
             src = src.rstrip() + "\n\n" + "".join(appended)
 
-        with open(SEARCH_CONFIG_PATH, "w", encoding="utf-8") as f:
-            f.write(src)
+        if src == original:
+            return False
+
+        _atomic_write(SEARCH_CONFIG_PATH, src)
+        return True
 
     except Exception as e:
         # best-effort: raise so caller can log
         raise
 
 
+def _atomic_write(path: str, data) -> None:
+    """Write text (or bytes) to path via a temp file in the same directory + os.replace."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        if isinstance(data, bytes):
+            f = os.fdopen(fd, "wb")
+        else:
+            f = os.fdopen(fd, "w", encoding="utf-8")
+        with f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def load_personals_settings() -> Dict[str, Any]:
     """Load top-level variables from config/personals.py into a dict.
     
     Used for personal information (name, email, phone, etc.) that can be mapped
-    to form fields.
+    to form fields. Served from the pickle cache when it is up to date.
     """
-    return _load_config_file(PERSONALS_CONFIG_PATH)
+    return _load_cached_config_file(PERSONALS_CONFIG_PATH)
 
 
 def load_resume_settings() -> Dict[str, Any]:
@@ -121,3 +154,45 @@ def _load_config_file(config_path: str) -> Dict[str, Any]:
         pass
 
     return settings
+
+
+def _cache_path(config_path: str) -> str:
+    return os.path.splitext(config_path)[0] + ".bin"
+
+
+def _load_cached_config_file(config_path: str) -> Dict[str, Any]:
+    """Like `_load_config_file`, but backed by a pickle cache next to the file.
+
+    The cache stores the `.py` file's (mtime_ns, size) alongside the settings
+    and is used only when both still match exactly; comparing the two files'
+    mtimes would miss an edit made within the filesystem's timestamp
+    resolution of the cache write. Otherwise the `.py` file is parsed and the
+    cache rewritten atomically (best-effort).
+    """
+    cache_path = _cache_path(config_path)
+    try:
+        st = os.stat(config_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+
+    if stamp is not None:
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+            # A corrupt or foreign file can raise almost anything from pickle.load
+            if (isinstance(cached, dict) and cached.get("stamp") == stamp
+                    and isinstance(cached.get("settings"), dict)):
+                return cached["settings"]
+        except Exception:
+            pass
+
+    settings = _load_config_file(config_path)
+    if settings and stamp is not None:
+        try:
+            payload = pickle.dumps({"stamp": stamp, "settings": settings},
+                                   protocol=pickle.HIGHEST_PROTOCOL)
+            _atomic_write(cache_path, payload)
+        except Exception:
+            pass
+    return settings
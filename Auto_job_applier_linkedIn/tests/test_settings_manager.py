@@ -0,0 +1,128 @@
+"""
+Unit tests for modules/settings_manager.py
+
+Config paths are redirected into a temporary directory so the real
+config/ files are never touched.
+"""
+import os
+import pickle
+
+import pytest
+
+from modules import settings_manager
+
+
+@pytest.fixture
+def personals_file(tmp_path, monkeypatch):
+    """Point PERSONALS_CONFIG_PATH at a throwaway personals.py."""
+    path = tmp_path / "personals.py"
+    path.write_text('first_name = "Ada"\nyears_of_experience = 5\n', encoding="utf-8")
+    monkeypatch.setattr(settings_manager, "PERSONALS_CONFIG_PATH", str(path))
+    return path
+
+
+class TestPersonalsCache:
+    """Test the pickle cache behind load_personals_settings."""
+
+    def test_first_load_parses_and_writes_cache(self, personals_file):
+        """Test the .py file is parsed and a .bin cache written next to it."""
+        settings = settings_manager.load_personals_settings()
+
+        assert settings == {"first_name": "Ada", "years_of_experience": 5}
+        cache = personals_file.with_suffix(".bin")
+        assert cache.exists()
+        st = os.stat(personals_file)
+        with open(cache, "rb") as f:
+            assert pickle.load(f) == {"stamp": (st.st_mtime_ns, st.st_size), "settings": settings}
+
+    def test_fresh_cache_is_used(self, personals_file):
+        """Test an up-to-date cache is returned without re-parsing."""
+        settings_manager.load_personals_settings()
+        cache = personals_file.with_suffix(".bin")
+        with open(cache, "rb") as f:
+            payload = pickle.load(f)
+        payload["settings"] = {"first_name": "Cached"}
+        with open(cache, "wb") as f:
+            pickle.dump(payload, f)
+
+        assert settings_manager.load_personals_settings() == {"first_name": "Cached"}
+
+    def test_stale_cache_is_rebuilt(self, personals_file):
+        """Test editing the .py file invalidates the cache."""
+        settings_manager.load_personals_settings()
+        cache = personals_file.with_suffix(".bin")
+        personals_file.write_text('first_name = "Grace"\n', encoding="utf-8")
+        newer = os.stat(cache).st_mtime_ns + 1_000_000_000
+        os.utime(personals_file, ns=(newer, newer))
+
+        assert settings_manager.load_personals_settings() == {"first_name": "Grace"}
+
+    def test_edit_with_same_mtime_is_detected(self, personals_file):
+        """Test an edit landing in the same timestamp tick is caught by the size."""
+        settings_manager.load_personals_settings()
+        mtime = os.stat(personals_file).st_mtime_ns
+        personals_file.write_text('first_name = "Grace Hopper"\n', encoding="utf-8")
+        os.utime(personals_file, ns=(mtime, mtime))
+
+        assert settings_manager.load_personals_settings() == {"first_name": "Grace Hopper"}
+
+    @pytest.mark.parametrize("content", [
+        b"not a pickle",
+        b"",
+        pickle.dumps(["a", "list"]),
+        pickle.dumps({"first_name": "Old format"}),
+    ])
+    def test_bad_cache_is_rebuilt(self, personals_file, content):
+        """Test a corrupt, foreign or old-format cache is re-parsed and rewritten."""
+        cache = personals_file.with_suffix(".bin")
+        cache.write_bytes(content)
+
+        assert settings_manager.load_personals_settings() == {"first_name": "Ada", "years_of_experience": 5}
+        with open(cache, "rb") as f:
+            assert pickle.load(f)["settings"] == {"first_name": "Ada", "years_of_experience": 5}
+        assert sorted(p.name for p in personals_file.parent.iterdir()) == ["personals.bin", "personals.py"]
+
+    def test_missing_file_returns_empty(self, tmp_path, monkeypatch):
+        """Test a missing personals.py yields {} and no cache file."""
+        path = tmp_path / "personals.py"
+        monkeypatch.setattr(settings_manager, "PERSONALS_CONFIG_PATH", str(path))
+
+        assert settings_manager.load_personals_settings() == {}
+        assert not path.with_suffix(".bin").exists()
+
+
+@pytest.fixture
+def search_file(tmp_path, monkeypatch):
+    """Point SEARCH_CONFIG_PATH at a throwaway search.py."""
+    path = tmp_path / "search.py"
+    path.write_text('search_location = "Remote"\neasy_apply_only = True\n', encoding="utf-8")
+    monkeypatch.setattr(settings_manager, "SEARCH_CONFIG_PATH", str(path))
+    return path
+
+
+class TestSaveSearchSettings:
+    """Test save_search_settings writes only when something changed."""
+
+    def test_changed_value_is_written(self, search_file):
+        """Test an existing key is replaced in place."""
+        assert settings_manager.save_search_settings({"search_location": "Berlin"}) is True
+        assert 'search_location = \'Berlin\'' in search_file.read_text(encoding="utf-8")
+
+    def test_new_key_is_appended(self, search_file):
+        """Test an unknown key is appended to the end of the file."""
+        settings_manager.save_search_settings({"switch_number": 10})
+        assert search_file.read_text(encoding="utf-8").rstrip().endswith("switch_number = 10")
+
+    def test_unchanged_values_skip_write(self, search_file):
+        """Test re-saving identical values leaves the file untouched."""
+        settings_manager.save_search_settings({"search_location": "Berlin"})
+        before = os.stat(search_file).st_mtime_ns
+        os.utime(search_file, ns=(before - 1_000_000_000, before - 1_000_000_000))
+
+        assert settings_manager.save_search_settings({"search_location": "Berlin"}) is False
+        assert os.stat(search_file).st_mtime_ns == before - 1_000_000_000
+
+    def test_no_temp_files_left_behind(self, search_file):
+        """Test the atomic write cleans up after itself."""
+        settings_manager.save_search_settings({"search_location": "Paris"})
+        assert sorted(p.name for p in search_file.parent.iterdir()) == ["search.py"]